@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# Peak RSS of a pipeline of column-adding commands over a wide table,
+# with and without pandas copy-on-write.
+# Usage: PYTHONPATH=lib python3 lab/copy_on_write_rss.py [ROWS] [COLUMNS]
+import os
+import subprocess
+import sys
+
+STAGES = [
+    ["copy", "c0:x0"],
+    ["seq", "i"],
+    ["cast", "c1:str"],
+    ["copy", "c2:x2"],
+    ["seq", "j"],
+    ["sed", "x0", "1", "2"],
+]
+
+CHILD = """
+import sys
+import numpy as np
+import pandas as pd
+from psv.main import Main
+from psv.command import main_make_xform
+from psv.instrument import max_rss
+
+rows, cols = int(sys.argv[1]), int(sys.argv[2])
+main = Main()
+inp = pd.DataFrame(np.random.rand(rows, cols), columns=[f"c{i}" for i in range(cols)])
+base = max_rss()
+env = {"history": [], "xform": {}, "Content-Type": None, "Content-Encoding": None}
+for argv in %r:
+    inp = main_make_xform(main, argv[0], argv[1:])(inp, env)
+print(base, max_rss())
+"""
+
+
+def measure(copy_on_write: str, rows: int, cols: int):
+    env = os.environ | {"PSV_COPY_ON_WRITE": copy_on_write}
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD % STAGES, str(rows), str(cols)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return [int(x) for x in result.stdout.split()]
+
+
+def main(rows: int, cols: int):
+    mib = 1024 * 1024
+    for copy_on_write in ("0", "1"):
+        base, peak = measure(copy_on_write, rows, cols)
+        print(
+            f"PSV_COPY_ON_WRITE={copy_on_write}  table {base / mib:8.1f} MiB"
+            f"  peak {peak / mib:8.1f} MiB  added {(peak - base) / mib:8.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    argv = sys.argv[1:]
+    main(int((argv[0:1] or ["100000"])[0]), int((argv[1:2] or ["200"])[0]))
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# Compares startup time of loading one command against loading all commands.
+# Usage: PYTHONPATH=lib python3 lab/import_time.py [RUNS]
+import statistics
+import subprocess
+import sys
+import time
+
+CASES = {
+    "import psv.main": "import psv.main",
+    "load_command('head')": "import psv.main; from psv.manifest import load_command; load_command('head')",
+    "load_all_commands()": "import psv.main; from psv.manifest import load_all_commands; load_all_commands()",
+}
+
+
+def measure(code: str, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(runs: int):
+    for name, code in CASES.items():
+        print(f"{name:<24} {measure(code, runs) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int((sys.argv[1:] or ["10"])[0]))
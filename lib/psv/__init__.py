@@ -1,27 +1 @@
-from . import command
-from . import pipeline
-from . import io
-from . import formats
-from . import generic
-from . import tsv
-from . import csv
-from . import markdown
-from . import json
-from . import pickle
-from . import html
-from . import sql
-from . import yaml
-from . import spreadsheet
-from . import process
-from . import sed
-from . import summary
-from . import cast
-from . import unit
-from . import metadata
-from . import extract
-from . import expr
-from . import repl
-
-# pylint: disable-next=redefined-builtin
-from . import help
-from . import example
+# Command modules are imported on demand: see manifest.py.
@@ -0,0 +1,88 @@
+from typing import Any, List
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import pandas as pd
+
+DEFAULT_CACHE_DIR = "~/.psv/cache"
+DEFAULT_CACHE_SIZE = 1024 * 1024 * 1024
+CACHE_VERSION = 1
+SUFFIX = ".pickle"
+
+
+class ResultCache:
+    """
+    Stores DataFrames output by pipeline stages on disk.
+
+    Each entry is keyed by the identity of the pipeline input
+    and the commands that produced the DataFrame.
+    Entries are removed least-recently used first,
+    when the total size exceeds max_size bytes.
+    """
+
+    def __init__(self, directory: str | None = None, max_size: int | None = None):
+        self.directory = os.path.expanduser(
+            directory or os.environ.get("PSV_CACHE_DIR") or DEFAULT_CACHE_DIR
+        )
+        self.max_size = max_size or int(
+            os.environ.get("PSV_CACHE_SIZE") or DEFAULT_CACHE_SIZE
+        )
+
+    def key(self, identity: Any, commands: List[List[str]]) -> str:
+        data = json.dumps([CACHE_VERSION, identity, commands], sort_keys=True)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        path = self.path(key)
+        try:
+            with open(path, "rb") as io:
+                value = pickle.load(io)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        # Mark as recently used:
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value: pd.DataFrame) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as io:
+                pickle.dump(value, io, protocol=5)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        evict_lru(self.directory, self.max_size, SUFFIX)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+
+def evict_lru(directory: str, max_size: int, suffix: str, related=()) -> None:
+    """
+    Removes files ending with suffix, least-recently modified first,
+    until their total size is at most max_size.
+    Files with the same name and a related suffix are removed with them.
+    """
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(suffix):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _mtime, size, _path in entries)
+    for _mtime, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        stem = path.removesuffix(suffix)
+        for remove in [path, *[stem + other for other in related]]:
+            try:
+                os.unlink(remove)
+            except FileNotFoundError:
+                pass
+        total -= size
@@ -0,0 +1,34 @@
+import os
+import pandas as pd
+import psv.cache as sut
+
+
+def test_put_get(tmp_path):
+    cache = sut.ResultCache(directory=str(tmp_path))
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    key = cache.key(["a.csv", 1, 2], [["in", "a.csv"]])
+    assert cache.get(key) is None
+    cache.put(key, df)
+    assert cache.get(key).equals(df)
+
+
+def test_key():
+    cache = sut.ResultCache(directory="/nonexistent")
+    key = cache.key(["a.csv", 1, 2], [["in", "a.csv"]])
+    assert key == cache.key(["a.csv", 1, 2], [["in", "a.csv"]])
+    assert key != cache.key(["a.csv", 1, 3], [["in", "a.csv"]])
+    assert key != cache.key(["a.csv", 1, 2], [["in", "a.csv"], ["head"]])
+
+
+def test_evict_least_recently_used(tmp_path):
+    df = pd.DataFrame({"a": range(1000)})
+    cache = sut.ResultCache(directory=str(tmp_path))
+    cache.put("old", df)
+    cache.put("new", df)
+    size = os.path.getsize(cache.path("old"))
+    os.utime(cache.path("old"), (1, 1))
+    cache.max_size = size * 2
+    cache.put("newer", df)
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+    assert cache.get("newer") is not None
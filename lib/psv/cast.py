@@ -48,9 +48,12 @@ class Cast(Command):
 
   """
 
+    def is_row_local(self):
+        return True
+
     def xform(self, inp, _env):
         conversions = parse_conversions(inp, self.args)
-        out = inp.copy()
+        out = inp.copy(deep=False)
         caster = self.make_caster()
         for out_col, inp_col, out_types in conversions:
             out[out_col] = caster.cast_col(out, inp_col, out_types)
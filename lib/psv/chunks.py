@@ -0,0 +1,99 @@
+from typing import Callable, Iterable, Iterator
+import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 100000
+
+
+class Chunks:
+    """
+    A lazy stream of DataFrames with the same columns.
+
+    Row-local commands are applied to each chunk as it arrives.
+    Other commands are barriers: they receive the concatenation of all chunks.
+    A Chunks stream can be iterated only once.
+    """
+
+    def __init__(self, chunks: Iterable[pd.DataFrame]):
+        self.chunks = chunks
+
+    def __repr__(self):
+        return "Chunks(...)"
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return iter(self.chunks)
+
+    def map(self, fun: Callable) -> "Chunks":
+        def map_chunks():
+            try:
+                for chunk in self:
+                    yield fun(chunk)
+            finally:
+                self.close()
+
+        return Chunks(map_chunks())
+
+    def take(self, limit: int) -> "Chunks":
+        """
+        The first `limit` rows.
+        Closes this stream once `limit` rows are taken,
+        so upstream readers stop reading.
+        """
+
+        def take_chunks():
+            taken = 0
+            try:
+                for chunk in self:
+                    chunk = chunk.iloc[: limit - taken]
+                    taken += len(chunk)
+                    yield chunk
+                    if taken >= limit:
+                        break
+            finally:
+                self.close()
+
+        return Chunks(take_chunks())
+
+    def aligned(self) -> "Chunks":
+        """
+        Reindexes each chunk to the columns of the chunks before it,
+        for readers that find columns in each chunk.
+        New columns are added after them; missing columns are NaN.
+        """
+
+        def aligned_chunks():
+            columns = pd.Index([])
+            try:
+                for chunk in self:
+                    new = chunk.columns.difference(columns, sort=False)
+                    columns = columns.append(new)
+                    yield chunk.reindex(columns=columns)
+            finally:
+                self.close()
+
+        return Chunks(aligned_chunks())
+
+    def closing(self, resource) -> "Chunks":
+        """
+        Closes `resource` when this stream is exhausted or closed.
+        """
+
+        def closing_chunks():
+            try:
+                yield from self
+            finally:
+                self.close()
+                resource.close()
+
+        return Chunks(closing_chunks())
+
+    def close(self) -> None:
+        if close := getattr(self.chunks, "close", None):
+            close()
+
+    def concat(self) -> pd.DataFrame:
+        frames = list(self)
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames)
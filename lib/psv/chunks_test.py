@@ -0,0 +1,46 @@
+import pandas as pd
+from psv.chunks import Chunks
+
+
+def test_map_and_concat():
+    frames = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]}, index=[2])]
+    chunks = Chunks(iter(frames)).map(lambda df: df[df["a"] != 2])
+    result = chunks.concat()
+    assert list(result["a"]) == [1, 3]
+    assert list(result.index) == [0, 2]
+
+
+def test_concat_empty():
+    assert Chunks([]).concat().empty
+
+
+def test_take_stops_reading():
+    read = []
+
+    def reader():
+        for i in range(10):
+            read.append(i)
+            yield pd.DataFrame({"a": [i * 2, i * 2 + 1]})
+
+    result = Chunks(reader()).take(3).concat()
+    assert list(result["a"]) == [0, 1, 2]
+    assert read == [0, 1]
+
+
+def test_take_zero_keeps_columns():
+    result = Chunks([pd.DataFrame({"a": [1]})]).take(0).concat()
+    assert list(result.columns) == ["a"]
+    assert result.empty
+
+
+def test_aligned():
+    frames = [
+        pd.DataFrame({"a": [1], "b": [2]}),
+        pd.DataFrame({"b": [3], "a": [4]}),
+        pd.DataFrame({"c": [5]}),
+    ]
+    result = list(Chunks(frames).aligned())
+    assert [list(df.columns) for df in result] == [["a", "b"], ["a", "b"], list("abc")]
+    assert result[1].values.tolist() == [[4, 3]]
+    assert result[2]["c"].tolist() == [5]
+    assert result[2][["a", "b"]].isna().all(axis=None)
@@ -7,6 +7,8 @@ from devdriven.cli.types import Argv
 
 # from devdriven.cli.macro import MacroExpander
 from devdriven.mime import short_and_long_suffix
+from .manifest import load_command, load_commands_for_suffixes
+from .compression import strip_compression_suffix
 
 Input = Any
 
@@ -18,6 +20,34 @@ class Command(cmd.Command):
     def xform(self, inp: Input, _env: dict) -> Any:
         return inp
 
+    # Each output row depends only on its input row:
+    # xform_chunks() is applied to each chunk of a Chunks stream.
+    # Otherwise, the stream is concatenated before xform().
+    def is_row_local(self) -> bool:
+        return False
+
+    def xform_chunks(self, chunks, env: dict) -> Any:
+        return chunks.map(lambda chunk: self.xform(chunk, env))
+
+    # Command may stop before reading all of its input:
+    # readers stream input in chunks so they can stop early.
+    def stops_early(self) -> bool:
+        return self.row_limit() is not None
+
+    # Number of leading input rows needed, if known before reading.
+    def row_limit(self) -> int | None:
+        return None
+
+    # Reads input given no input:
+    # it may read less, given the commands that follow it (see pushdown.py).
+    def is_reader(self) -> bool:
+        return False
+
+    # Output depends only on input and argv:
+    # it can be stored in and reused from a ResultCache.
+    def is_cacheable(self) -> bool:
+        return True
+
     def make_xform(self, argv: Argv):  # -> Self:
         return main_make_xform(self.main, argv[0], argv[1:]) or Exception(
             f"unknown command {argv[0]!r}"
@@ -34,6 +64,8 @@ def main_make_xform(main, klass_or_name: str | Type, argv: Argv) -> Command | No
     #   cmd_and_args = [klass_or_name, *argv]
     #   expansion = MacroExpander(macros=macros).expand(cmd_and_args)
     #   klass_or_name, *argv = expansion
+    if isinstance(klass_or_name, str) and not app.descriptor(klass_or_name):
+        load_command(klass_or_name)
     if desc := app.descriptor(klass_or_name):
         xform = desc.klass()
         xform.main = main
@@ -46,6 +78,7 @@ def main_make_xform(main, klass_or_name: str | Type, argv: Argv) -> Command | No
 
 def find_format(path: str, klass: Type) -> Type | None:
     short_suffix, long_suffix = short_and_long_suffix(path)
+    load_commands_for_suffixes([long_suffix, short_suffix])
     valid_descs = [dsc for dsc in app.descriptors if issubclass(dsc.klass, klass)]
     for dsc in valid_descs:
         if long_suffix in suffix_list(dsc):
@@ -53,6 +86,9 @@ def find_format(path: str, klass: Type) -> Type | None:
     for dsc in valid_descs:
         if short_suffix in suffix_list(dsc):
             return dsc.klass
+    # Format of compressed file is the format of its inner suffix:
+    if (inner := strip_compression_suffix(path)) != path:
+        return find_format(inner, klass)
     return None
 
 
@@ -0,0 +1,100 @@
+from typing import Any
+import bz2
+import gzip
+import lzma
+import os
+import re
+
+# Compression by suffix:
+SUFFIXES = {
+    ".gz": "gzip",
+    ".xz": "xz",
+    ".bz2": "bz2",
+    ".zst": "zstd",
+}
+# Block size, then the magic of the first block or of the end of an empty stream:
+BZ2_MAGIC = rb"BZh[1-9](?:\x31\x41\x59\x26\x53\x59|\x17\x72\x45\x38\x50\x90)"
+# Compression by leading bytes:
+MAGIC = {
+    re.compile(rb"\x1f\x8b"): "gzip",
+    re.compile(rb"\xfd7zXZ\x00"): "xz",
+    re.compile(BZ2_MAGIC): "bz2",
+    re.compile(rb"\x28\xb5\x2f\xfd"): "zstd",
+}
+# Leading bytes matched by MAGIC:
+MAGIC_SIZE = 10
+
+
+def compression_for_path(path: str | None) -> str | None:
+    return SUFFIXES.get(os.path.splitext(path or "")[1])
+
+
+def strip_compression_suffix(path: str) -> str:
+    if compression_for_path(path):
+        return os.path.splitext(path)[0]
+    return path
+
+
+def sniff_compression(head: bytes) -> str | None:
+    for magic_rx, compression in MAGIC.items():
+        if magic_rx.match(head):
+            return compression
+    return None
+
+
+def decompress_readable(readable, compression: str) -> Any:
+    """
+    A readable that decompresses readable as it is read.
+    Closing it does not close readable.
+    """
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=readable, mode="rb")
+    if compression == "xz":
+        return lzma.LZMAFile(readable, mode="rb")
+    if compression == "bz2":
+        return bz2.BZ2File(readable, mode="rb")
+    if compression == "zstd":
+        return zstandard().ZstdDecompressor().stream_reader(
+            readable, read_across_frames=True, closefd=False
+        )
+    raise Exception(f"unknown compression {compression!r}")
+
+
+def compress_writable(writable, compression: str) -> Any:
+    """
+    A writable that compresses into writable as it is written.
+    Closing it does not close writable.
+    """
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=writable, mode="wb")
+    if compression == "xz":
+        return lzma.LZMAFile(writable, mode="wb")
+    if compression == "bz2":
+        return bz2.BZ2File(writable, mode="wb")
+    if compression == "zstd":
+        # threads=-1: compress with a thread for each CPU:
+        return zstandard().ZstdCompressor(threads=-1).stream_writer(
+            writable, closefd=False
+        )
+    raise Exception(f"unknown compression {compression!r}")
+
+
+def compress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data)
+    if compression == "xz":
+        return lzma.compress(data)
+    if compression == "bz2":
+        return bz2.compress(data)
+    if compression == "zstd":
+        return zstandard().ZstdCompressor(threads=-1).compress(data)
+    raise Exception(f"unknown compression {compression!r}")
+
+
+def zstandard():
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        import zstandard as zstd  # type: ignore
+    except ImportError as exc:
+        raise Exception("zstd compression requires the zstandard package") from exc
+    return zstd
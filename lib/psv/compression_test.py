@@ -0,0 +1,45 @@
+from io import BytesIO
+import bz2
+import gzip
+import lzma
+import pytest
+import psv.compression as sut
+
+
+def test_compression_for_path():
+    fut = sut.compression_for_path
+    assert fut("a.tsv.gz") == "gzip"
+    assert fut("a.tsv.xz") == "xz"
+    assert fut("a.bz2") == "bz2"
+    assert fut("a.csv.zst") == "zstd"
+    assert fut("a.tsv") is None
+    assert fut(None) is None
+
+
+def test_strip_compression_suffix():
+    fut = sut.strip_compression_suffix
+    assert fut("logs/access.tsv.gz") == "logs/access.tsv"
+    assert fut("logs/access.tsv") == "logs/access.tsv"
+
+
+def test_sniff_compression():
+    fut = sut.sniff_compression
+    assert fut(gzip.compress(b"abc")[: sut.MAGIC_SIZE]) == "gzip"
+    assert fut(lzma.compress(b"abc")[: sut.MAGIC_SIZE]) == "xz"
+    assert fut(bz2.compress(b"abc")[: sut.MAGIC_SIZE]) == "bz2"
+    assert fut(bz2.compress(b"")[: sut.MAGIC_SIZE]) == "bz2"
+    assert fut(b"a\tb\n") is None
+    assert fut(b"BZh9 text that is not bzip2") is None
+    assert fut(b"") is None
+
+
+@pytest.mark.parametrize("compression", ["gzip", "xz", "bz2"])
+def test_round_trip(compression):
+    out = BytesIO()
+    with sut.compress_writable(out, compression) as writable:
+        writable.write(b"a\tb\n1\t2\n")
+    assert not out.closed
+    data = out.getvalue()
+    assert sut.sniff_compression(data[: sut.MAGIC_SIZE]) == compression
+    readable = sut.decompress_readable(BytesIO(data), compression)
+    assert readable.read() == b"a\tb\n1\t2\n"
@@ -1,7 +1,17 @@
 from pathlib import Path
+from io import BytesIO
+import codecs
+import mmap
+import os
 from devdriven.tempfile import tempfile_from_readable
 from devdriven.url import url_normalize, url_is_file, url_is_stdio
 from devdriven.user_agent import UserAgent, with_http_redirects
+from .compression import (
+    MAGIC_SIZE,
+    compression_for_path,
+    decompress_readable,
+    sniff_compression,
+)
 
 
 class Content:
@@ -9,6 +19,8 @@ class Content:
     Encapsulates fetching HTTP body, file contents or STDIO.
     content() - the decoded body, defaults to utf-8.
     body() - the bytes of HTTP body or file contents.
+    Local files are read directly or memory-mapped.
+    Compressed content is decompressed by content() and body_as_decompressed().
     """
 
     # pylint: disable-next=too-many-arguments,disable-next=too-many-positional-arguments
@@ -17,7 +29,12 @@ class Content:
         self.headers = headers or {}
         self._encoding = encoding
         self.stdin, self.stdout = stdin, stdout
-        self._body = self._content = self._response = None
+        self._body = self._content = self._response = self._mmap = None
+        self._readables = []
+        # An HttpCache for GET responses:
+        self.http_cache = None
+        # A UserAgent shared with other Content:
+        self.user_agent = None
 
     def __repr__(self):
         return f"Content(url={self.url!r})"
@@ -34,6 +51,11 @@ class Content:
     def is_stdio(self):
         return url_is_stdio(self.url)
 
+    def local_path(self) -> str | None:
+        if self.is_file() and not self.is_stdio():
+            return self.url.path
+        return None
+
     @property
     def encoding(self) -> str | None:
         return self._encoding
@@ -56,8 +78,13 @@ class Content:
         if encoding and self._encoding != encoding:
             self.encoding = encoding
         if not self._content:
-            body = self.body()
-            self._content = body.decode(self.encoding or "utf-8")
+            if compression := self.compression():
+                body = self.body_as_decompressed(compression).read()
+                self._content = body.decode(self.encoding or "utf-8")
+            elif self._body is None and (path := self.local_path()):
+                self._content = decode_file(path, self.encoding or "utf-8")
+            else:
+                self._content = self.body().decode(self.encoding or "utf-8")
         return self._content
 
     def body(self):
@@ -70,11 +97,73 @@ class Content:
                 readable.close()
         return self._body
 
+    def identity(self):
+        """
+        Identifies the current version of the content, if possible:
+        a file's path, modification time and size, or a URL's ETag or Last-Modified.
+        STDIN has no identity.
+        """
+        if self.is_stdio():
+            return None
+        if self.is_file():
+            stat = os.stat(self.url.path)
+            return [self.url.path, stat.st_mtime_ns, stat.st_size]
+
+        def do_head(url):
+            return UserAgent().request(
+                "head",
+                url,
+                headers=self.headers,
+                stdin=self.stdin,
+                stdout=self.stdout,
+            )
+
+        response = with_http_redirects(do_head, self.url)
+        if response.status != 200:
+            return None
+        version = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        return version and [str(self.url), version]
+
     def body_as_readable(self):
-        # if self.is_file() and not self.is_stdio():
-        #   return open(self.url.path, 'rb')
+        if path := self.local_path():
+            return open(path, "rb")
         return self.response()
 
+    def compression(self) -> str | None:
+        """
+        The compression of the body, by URL suffix,
+        otherwise by the leading bytes of a local file or response.
+        """
+        if compression := compression_for_path(self.url.path):
+            return compression
+        if path := self.local_path():
+            with open(path, "rb") as io:
+                return sniff_compression(io.read(MAGIC_SIZE))
+        readable = self.response()
+        if hasattr(readable, "peek"):
+            return sniff_compression(readable.peek(MAGIC_SIZE)[:MAGIC_SIZE])
+        return None
+
+    def body_as_decompressed(self, compression: str):
+        """
+        A readable that decompresses the body as it is read.
+        Closed by close().
+        """
+        readable = self.body_as_readable()
+        if self.local_path():
+            self._readables.append(readable)
+        self._readables.append(decompress_readable(readable, compression))
+        return self._readables[-1]
+
+    def body_as_mmap(self):
+        """
+        A read-only memory map of a local file.
+        Closed by close().
+        """
+        if self._mmap is None:
+            self._mmap = map_file(self.local_path())
+        return self._mmap
+
     def body_as_file(self, fun, suffix=None):
         if self.is_file() and not self.is_stdio():
             return fun(self.url.path)
@@ -85,29 +174,58 @@ class Content:
         if self._response:
             return self._response
 
-        def do_get(url):
+        def do_get(url, headers=None):
             return UserAgent().request(
                 "get",
                 url,
-                headers=self.headers,
+                headers=self.headers | (headers or {}),
                 preload_content=False,
                 stdin=self.stdin,
                 stdout=self.stdout,
             )
 
-        response = with_http_redirects(do_get, self.url)
-        if not response.status == 200:
-            raise Exception(f"GET {self.url} : status {response.status}")
+        if self.http_cache and not self.is_file():
+
+            def fetch(headers):
+                return with_http_redirects(do_get, self.url, headers)
+
+            response = self.http_cache.get(str(self.url), fetch)
+        else:
+            response = with_http_redirects(do_get, self.url)
+            if not response.status == 200:
+                raise Exception(f"GET {self.url} : status {response.status}")
         self._response = response
         return response
 
+    def close(self):
+        """
+        Stops reading the response and closes local files.
+        STDIN is left open.
+        """
+        if self._response is not None and not self.is_stdio():
+            self._response.close()
+        self._response = None
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = None
+        for readable in reversed(self._readables):
+            readable.close()
+        self._readables = []
+
+    def release(self):
+        """
+        Frees the cached body and content, after they are parsed.
+        """
+        self._body = self._content = None
+        self.close()
+
     def put(self, body, headers=None):
         if isinstance(body, str):
             body = body.encode(self.encoding or "utf-8")
         headers = self.headers | (headers or {})
 
         def do_put(url, body):
-            return UserAgent().request(
+            return (self.user_agent or UserAgent()).request(
                 "put",
                 url,
                 body=body,
@@ -118,5 +236,24 @@ class Content:
 
         self._response = with_http_redirects(do_put, self.url, body)
         if not 200 <= self._response.status <= 299:
-            raise Exception("PUT {url} : unexpected status : {self._response.status}")
+            raise Exception(
+                f"PUT {self.url} : unexpected status : {self._response.status}"
+            )
         return self
+
+
+def map_file(path: str):
+    with open(path, "rb") as io:
+        # Empty files cannot be mapped:
+        if not os.fstat(io.fileno()).st_size:
+            return BytesIO()
+        return mmap.mmap(io.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def decode_file(path: str, encoding: str) -> str:
+    # Decodes a mapped file, without a copy of its bytes:
+    mapped = map_file(path)
+    if isinstance(mapped, BytesIO):
+        return ""
+    with mapped:
+        return codecs.decode(mapped, encoding)
@@ -0,0 +1,21 @@
+from psv.content import Content
+
+
+def test_local_file(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("héllo\n", encoding="utf-8")
+    content = Content(url=str(path))
+    assert content.local_path() == str(path)
+    assert content.content() == "héllo\n"
+    assert content.body_as_mmap().read() == "héllo\n".encode("utf-8")
+    content.release()
+    assert content.body() == "héllo\n".encode("utf-8")
+
+
+def test_empty_local_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    content = Content(url=str(path))
+    assert content.content() == ""
+    assert content.body_as_mmap().read() == b""
+    content.close()
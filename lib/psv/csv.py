@@ -10,7 +10,10 @@ class CsvIn(FormatIn):
       csv-in - Parse CSV.
       aliases: -csv
 
-    --header  |  First row is header.  Default: True.
+    --header            |  First row is header.  Default: True.
+    --chunk-size=ROWS   |  Stream rows in chunks of ROWS.
+    --parse-jobs=N      |  Processes parsing a local file.  Default: 1.
+    --engine=NAME       |  Parser: `c` or `pyarrow`.  Default: `c`.
 
     # Use first row as header:
     $ psv in a.csv // -csv
@@ -24,8 +27,27 @@ class CsvIn(FormatIn):
       :suffixes: .csv
     """
 
+    def wants_input_file(self):
+        return True
+
     def format_in(self, readable, _env):
-        return read_table_with_header(readable, self.opt("header", True), sep=",")
+        return read_table_with_header(
+            readable,
+            self.opt("header", True),
+            jobs=self.opt("parse-jobs"),
+            engine=self.opt("engine"),
+            pushdown=self.pushdown,
+            sep=",",
+        )
+
+    def format_in_chunks(self, readable, _env, chunk_size):
+        return read_table_with_header(
+            readable,
+            self.opt("header", True),
+            pushdown=self.pushdown,
+            sep=",",
+            chunksize=chunk_size,
+        )
 
 
 @command
@@ -40,5 +62,12 @@ class CsvOut(FormatOut):
       :suffixes: .csv
     """
 
+    def is_row_local(self):
+        return True
+
     def format_out(self, inp, _env, writeable):
         inp.to_csv(writeable, header=True, index=False, date_format="iso")
+
+    def format_out_chunks(self, chunks, _env, writeable):
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(writeable, header=i == 0, index=False, date_format="iso")
@@ -34,6 +34,9 @@ class Example(Command):
 
     """
 
+    def is_cacheable(self) -> bool:
+        return False
+
     def xform(self, _inp, _env):
         registry = ExampleRegistry(main=self.main)
         all_examples = registry.all_examples(generate=self.opt("generate"))
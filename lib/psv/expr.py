@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from devdriven.pandas import new_empty_df_like, normalize_column_name
 from devdriven import lazy_import
 from .command import Command, section, command
+from .chunks import Chunks
 
 # pylint: enable=unused-import,wildcard-import,redefined-builtin,unused-wildcard-import
 
@@ -29,6 +30,8 @@ class Eval(Command):
       * `ind`    : row index.
       * `offset` : row offset (zero origin).
 
+    When input is streamed in chunks, `inp` and `out` are bound to the current chunk.
+
     When expression returns:
       * "FINISH" : all remaining rows are dropped.
       * "BREAK"  : all remaining rows (inclusive) are dropped.
@@ -49,7 +52,37 @@ class Eval(Command):
 
     """
 
+    # Expressions may use the environment, time or random numbers:
+    def is_cacheable(self) -> bool:
+        return False
+
+    def is_row_local(self):
+        return True
+
     def xform(self, inp, env):
+        out, _finished = self.eval_rows(self.make_fun(inp), inp, env, 0)
+        return out
+
+    def xform_chunks(self, chunks, env):
+        def eval_chunks():
+            fun, offset = None, 0
+            try:
+                for chunk in chunks:
+                    fun = fun or self.make_fun(chunk)
+                    out, finished = self.eval_rows(fun, chunk, env, offset)
+                    offset += len(chunk)
+                    yield out
+                    if finished:
+                        break
+            finally:
+                chunks.close()
+
+        return Chunks(eval_chunks())
+
+    def stops_early(self):
+        return any(re.search(r"\b(?:FINISH|BREAK)\b", arg) for arg in self.args)
+
+    def make_fun(self, inp):
         cols = list(filter(len, self.opt("columns", "").split(","))) or list(
             inp.columns
         )
@@ -57,18 +90,19 @@ class Eval(Command):
             ident_to_column = {normalize_column_name(col): col for col in cols}
         else:
             ident_to_column = dict(zip(cols, cols))
-        fun = make_expr_fun(self.create_expr(), ident_to_column)
+        return make_expr_fun(self.create_expr(), ident_to_column)
+
+    def eval_rows(self, fun, inp, env, offset):
         out = new_empty_df_like(inp)
-        offset = 0
         for ind, row in inp.iterrows():
             result = fun(inp, env, out, ind, row, offset)
             if result == "BREAK":
-                break
+                return out, True
             self.process_row(inp, row, out, result)
             if result == "FINISH":
-                break
+                return out, True
             offset += 1
-        return out
+        return out, False
 
     def create_expr(self):
         return ";".join(self.args + ["return None"])
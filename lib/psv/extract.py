@@ -37,6 +37,7 @@ class Extract(Command):
         cols, inds = columns_for_rx(rx, unnamed)
         if isinstance(inp, Content):
             recs = str(inp).splitlines()
+            inp.release()
         elif isinstance(inp, list):
             recs = inp
         else:
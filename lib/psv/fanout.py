@@ -0,0 +1,93 @@
+from typing import List
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from .command import Command, section, command
+
+section("Pipeline", 80)
+
+
+@command
+class FanOut(Command):
+    """
+    fan-out - Run sub-pipelines concurrently on the same input.
+
+    Aliases: fork
+
+    Each sub-pipeline receives the same input table.
+    The tables returned by sub-pipelines are concatenated.
+    If no sub-pipeline returns a table, the input is passed through.
+
+    Options must precede the first sub-pipeline.
+
+    {{ COMMAND // ... }} ...  |  Sub-pipelines.
+    --threads=N               |  Maximum concurrent sub-pipelines.  Default: one for each.
+    --column=NAME             |  Add a column with the number of the sub-pipeline.
+
+    # Count by Payer and save CSV, reading and parsing input once:
+    $ psv in transfers.csv // fan-out {{ count Payer }} {{ csv- // o /tmp/transfers-copy.csv }} // md
+
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.branches = []
+
+    def is_cacheable(self) -> bool:
+        return False
+
+    def parse_argv(self, argv):
+        i = argv.index("{{") if "{{" in argv else len(argv)
+        super().parse_argv(argv[:i])
+        self.branches = split_branches(argv[i:])
+        self.argv = argv
+        return self
+
+    def xform(self, inp, env):
+        pipes = [
+            # pylint: disable-next=no-member
+            self.main.parse_pipeline(f"{self.name}.{i}", argv).optimize()
+            for i, argv in enumerate(self.branches, 1)
+        ]
+
+        def run(pipe):
+            return pipe.xform(inp, env | {"history": [], "xform": {}})
+
+        threads = int(self.opt("threads", 0)) or max(len(pipes), 1)
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(run, pipes))
+        frames = [
+            (i, result)
+            for i, result in enumerate(results, 1)
+            if isinstance(result, pd.DataFrame)
+        ]
+        if not frames:
+            return inp
+        if col := self.opt("column"):
+            frames = [(i, df.assign(**{col: i})) for i, df in frames]
+        env["Content-Type"] = "application/x-pandas-dataframe"
+        env["Content-Encoding"] = None
+        return pd.concat([df for _i, df in frames], ignore_index=True)
+
+
+def split_branches(argv: List[str]) -> List[List[str]]:
+    branches: List[List[str]] = []
+    branch: List[str] = []
+    depth = 0
+    for arg in argv:
+        if arg == "{{":
+            depth += 1
+            if depth == 1:
+                branch = []
+                continue
+        elif arg == "}}":
+            depth -= 1
+            if depth == 0:
+                branches.append(branch)
+                continue
+        if depth > 0:
+            branch.append(arg)
+        else:
+            raise Exception(f"fan-out: unexpected {arg!r} outside {{{{ }}}}")
+    if depth != 0:
+        raise Exception(f"fan-out: unbalanced {{{{ }}}} in {argv!r}")
+    return branches
@@ -0,0 +1,20 @@
+import pytest
+from psv.fanout import split_branches
+
+
+def test_split_branches():
+    assert not split_branches([])
+    assert split_branches(["{{", "a", "//", "b", "}}", "{{", "c", "}}"]) == [
+        ["a", "//", "b"],
+        ["c"],
+    ]
+    assert split_branches(["{{", "a", "{{", "b", "}}", "}}"]) == [
+        ["a", "{{", "b", "}}"]
+    ]
+
+
+def test_split_branches_errors():
+    with pytest.raises(Exception):
+        split_branches(["{{", "a"])
+    with pytest.raises(Exception):
+        split_branches(["a"])
@@ -0,0 +1,74 @@
+from .command import section, command
+from .formats import FormatIn, FormatOut, seekable
+from .pushdown import filter_expression
+
+section("Format", 20)
+
+
+@command
+class FeatherIn(FormatIn):
+    """
+    feather-in - Read Feather (Arrow IPC file).
+    alias: -feather, arrow-in, -arrow
+
+    Requires pyarrow.
+    Reads only the columns used before a following `cut`.
+    Rows are filtered in Arrow for simple `select` comparisons.
+
+    $ psv in a.tsv // feather- // o /tmp/a.feather
+    $ psv in /tmp/a.feather // select 'a > 1' // cut a,b // md
+
+    :suffixes: .feather, .arrow
+    """
+
+    def default_encoding(self):
+        return None
+
+    def wants_input_file(self):
+        return True
+
+    def format_in(self, readable, _env):
+        # pylint: disable-next=import-outside-toplevel
+        import pyarrow.feather
+
+        table = pyarrow.feather.read_table(seekable(readable), memory_map=True)
+        if (columns := self.pushdown.columns_in(table.column_names)) is not None:
+            table = table.select(columns)
+        if filters := self.pushdown.filters_in(table.column_names):
+            try:
+                table = table.filter(filter_expression(filters))
+            # Predicates that do not apply to the column types are left to select:
+            except (pyarrow.ArrowException, TypeError, ValueError):
+                pass
+        return table.to_pandas()
+
+
+@command
+class FeatherOut(FormatOut):
+    """
+    feather-out - Write Feather (Arrow IPC file).
+    alias: feather-, feather, arrow-out, arrow-
+
+    Requires pyarrow.
+
+    --compression=NAME  |  lz4, zstd or none.  Default: lz4.
+
+    $ psv in a.tsv // feather- // o /tmp/a.feather
+
+    :suffixes: .feather, .arrow
+    """
+
+    def default_encoding(self):
+        return None
+
+    def setup_env(self, inp, env):
+        super().setup_env(inp, env)
+        env["Content-Type"] = "application/vnd.apache.arrow.file"
+
+    def format_out(self, inp, _env, writeable):
+        compression = self.opt("compression", "lz4")
+        # Feather does not store an index:
+        if compression == "none":
+            compression = "uncompressed"
+        inp.reset_index(drop=True).to_feather(writeable, compression=compression)
+
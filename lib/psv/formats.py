@@ -1,10 +1,16 @@
-from typing import Any
+from typing import Any, List
+from functools import partial
 from io import StringIO, BytesIO
+import operator
 from devdriven.util import not_implemented
 from devdriven.mime import content_type_for_suffixes
 import pandas as pd
 from .command import Command, section, suffix_list
 from .content import Content
+from .chunks import Chunks
+from .caster import TYPE_ALIASES
+from .parallel_table import parallel_jobs, read_table_parallel
+from .pushdown import Pushdown
 
 section("Format", 20)
 
@@ -16,6 +22,10 @@ class FormatBase(Command):
     def wants_input_file(self) -> bool:
         return False
 
+    # Format reads compressed input itself:
+    def decompresses_input(self) -> bool:
+        return False
+
     def wants_output_file(self) -> bool:
         return False
 
@@ -27,6 +37,18 @@ class FormatBase(Command):
 
 
 class FormatIn(FormatBase):
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Set by Pipeline: see pushdown.py.
+        self.pushdown = Pushdown()
+
+    def is_reader(self) -> bool:
+        return True
+
+    # Input already parsed by `in` passes through:
+    def is_row_local(self) -> bool:
+        return True
+
     def xform(self, inp, env):
         if isinstance(inp, pd.DataFrame):
             return inp
@@ -40,22 +62,63 @@ class FormatIn(FormatBase):
             else:
                 readable = StringIO(inp)
         elif isinstance(inp, Content):
-            readable = inp.response()
+            readable = self.content_readable(inp)
         else:
             readable = None
-        return self.format_in(readable, env)
+        if chunk_size := self.chunk_size(env):
+            chunks = self.format_in_chunks(readable, env, chunk_size)
+            if isinstance(inp, Content):
+                chunks = chunks.closing(inp)
+            return chunks
+        try:
+            return self.format_in(readable, env)
+        finally:
+            if isinstance(inp, Content):
+                inp.release()
+
+    # Compressed input is decompressed as it is read.
+    # Local files are given to parsers as a path, if wanted,
+    # otherwise memory-mapped:
+    def content_readable(self, content: Content):
+        if not self.decompresses_input() and (compression := content.compression()):
+            return content.body_as_decompressed(compression)
+        if path := content.local_path():
+            if self.wants_input_file():
+                return path
+            return content.body_as_mmap()
+        return content.response()
+
+    def chunk_size(self, env) -> int | None:
+        if size := self.opt("chunk-size", env.get("input.chunk_size")):
+            return int(size)
+        return None
+
+    # Formats that cannot be parsed incrementally yield a single chunk:
+    def format_in_chunks(self, readable, env, _chunk_size) -> Chunks:
+        return Chunks([self.format_in(readable, env)])
 
 
 class FormatOut(FormatBase):
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Set by Pipeline when the next command writes the output:
+        # the output is formatted as it is written.
+        self.streaming = False
+        # Set by Pipeline when the next command writes a single file:
+        self.output_path: str | None = None
+
     def xform(self, inp, env):
         self.setup_env(inp, env)
-        # ???: handle streaming:
-        if self.default_encoding():
-            out = StringIO()
-        else:
-            out = BytesIO()
-        self.format_out(inp, env, out)
-        return out.getvalue()
+        output = FormattedOutput(self, inp, env)
+        return output if self.streaming else output.getvalue()
+
+    def xform_chunks(self, chunks, env):
+        return self.xform(chunks, env)
+
+    # Formats that can be written incrementally override this
+    # and is_row_local():
+    def format_out_chunks(self, chunks, env, writable) -> None:
+        self.format_out(chunks.concat(), env, writable)
 
     def setup_env(self, _inp, env) -> None:
         desc = self.command_descriptor()
@@ -64,14 +127,136 @@ class FormatOut(FormatBase):
         )
 
 
-def read_table_with_header(readable, first_row_is_header, **kwargs) -> pd.DataFrame:
+class FormattedOutput:
+    """
+    The output of a FormatOut, formatted when written.
+    """
+
+    def __init__(self, format_out: FormatOut, inp: Any, env: dict):
+        self.format_out = format_out
+        self.inp = inp
+        self.env = env
+
+    def __repr__(self):
+        return f"FormattedOutput({self.format_out.name!r})"
+
+    def to_dict(self):
+        return repr(self)
+
+    def is_binary(self) -> bool:
+        return not self.format_out.default_encoding()
+
+    def write_to(self, writable) -> None:
+        if isinstance(self.inp, Chunks):
+            try:
+                self.format_out.format_out_chunks(self.inp, self.env, writable)
+            finally:
+                self.inp.close()
+        else:
+            self.format_out.format_out(self.inp, self.env, writable)
+
+    def getvalue(self) -> str | bytes:
+        out = BytesIO() if self.is_binary() else StringIO()
+        self.write_to(out)
+        return out.getvalue()
+
+
+def read_table_with_header(
+    readable, first_row_is_header, jobs=None, engine=None, pushdown=None, **kwargs
+) -> pd.DataFrame | Chunks:
     # print(repr(first_row_is_header))
     header = 0 if first_row_is_header else None
-    kwargs = kwargs | {"header": header}
+    dates = []
+    # Names in pushdown are names in the header:
+    if header == 0 and pushdown:
+        if (columns := pushdown.columns) is not None and engine != "pyarrow":
+            # Parallel parsers pickle this:
+            kwargs["usecols"] = partial(operator.contains, set(columns))
+        dates = date_columns(pushdown.types)
+
+    def finish(df):
+        return parse_dates(set_default_columns(df, header), dates)
+
+    if kwargs.get("chunksize"):
+        # The pyarrow engine does not read in chunks:
+        engine = None
+    if engine == "pyarrow":
+        # The pyarrow engine parses with a thread for each CPU:
+        return finish(pd.read_table(readable, header=header, engine=engine, **kwargs))
+    if isinstance(readable, str) and not kwargs.get("chunksize"):
+        if (jobs := parallel_jobs(jobs)) > 1:
+            try:
+                return finish(
+                    read_table_parallel(readable, header, jobs, engine=engine, **kwargs)
+                )
+            # Ranges split at a quote in an unquoted field are parsed as a whole:
+            except pd.errors.ParserError:
+                pass
+    kwargs = kwargs | {"header": header, "engine": engine}
+    # A local file path is read through a memory map:
+    if isinstance(readable, str):
+        kwargs["memory_map"] = True
     # print(repr(kwargs))
-    df = pd.read_table(readable, **kwargs)
+    if kwargs.get("chunksize"):
+        return Chunks(read_table_chunks(readable, finish, kwargs))
+    return finish(pd.read_table(readable, **kwargs))
+
+
+def read_table_chunks(readable, finish, kwargs):
+    with pd.read_table(readable, **kwargs) as reader:
+        for df in reader:
+            yield finish(df)
+
+
+def date_columns(types: dict) -> List[str]:
+    # Columns that a following cast parses as datetime:
+    return [
+        col for col, typ in types.items() if TYPE_ALIASES.get(typ, typ) == "datetime"
+    ]
+
+
+ISO_DATETIME_RX = (
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:[.,]\d+)?)?(?:Z|[+-]\d{2}(?::?\d{2})?)?)?"
+)
+
+
+def parse_dates(df, cols) -> pd.DataFrame:
+    """
+    Parses ISO 8601 strings in cols as naive UTC datetimes,
+    as `cast COL:datetime` would.
+    Columns with values that are not a full date or date and time,
+    or that do not parse, are unchanged: cast parses them.
+    """
+    for col in cols:
+        if col in df.columns and df[col].dtype == object:
+            # Partial dates, like "2021-06", are completed differently by cast:
+            if not df[col].dropna().astype(str).str.fullmatch(ISO_DATETIME_RX).all():
+                continue
+            try:
+                parsed = pd.to_datetime(df[col], format="ISO8601", utc=True)
+            except (ValueError, TypeError):
+                continue
+            df[col] = parsed.dt.tz_localize(None)
+    return df
+
+
+def set_default_columns(df, header) -> pd.DataFrame:
     if header is None:
         width = df.shape[1]
         cols = [f"c{i + 1}" for i in range(width)]
         df = df.set_axis(cols, axis=1)
     return df
+
+
+def seekable(readable):
+    # Columnar formats are read out of order:
+    if isinstance(readable, str) or readable.seekable():
+        return readable
+    return BytesIO(readable.read())
+
+
+def rewind(readable):
+    if not isinstance(readable, str):
+        readable.seek(0)
+    return readable
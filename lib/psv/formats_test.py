@@ -0,0 +1,54 @@
+import pandas as pd
+from psv.chunks import Chunks
+from psv.csv import CsvOut
+from psv.pushdown import Pushdown
+import psv.formats as sut
+
+
+def test_formatted_output():
+    inp = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    output = sut.FormattedOutput(CsvOut(), inp, {})
+    assert output.getvalue() == "a,b\n1,x\n2,y\n"
+    assert not output.is_binary()
+
+
+def test_formatted_output_chunks():
+    chunks = Chunks([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})])
+    output = sut.FormattedOutput(CsvOut(), chunks, {})
+    assert output.getvalue() == "a\n1\n2\n3\n"
+
+
+def test_read_table_with_pushdown(tmp_path):
+    path = tmp_path / "a.csv"
+    path.write_text("a,b,t\n1,x,2020-01-02\n2,y,2020-01-03T04:05:06+01:00\n3,z,\n")
+    pushdown = Pushdown(columns=["t", "a", "q"], types={"t": "dt", "a": "datetime"})
+    df = sut.read_table_with_header(str(path), True, pushdown=pushdown, sep=",")
+    assert list(df.columns) == ["a", "t"]
+    assert df["a"].dtype == "int64"
+    assert list(df["t"].astype(str)) == [
+        "2020-01-02 00:00:00",
+        "2020-01-03 03:05:06",
+        "NaT",
+    ]
+    chunks = sut.read_table_with_header(
+        str(path), True, pushdown=pushdown, sep=",", chunksize=2
+    )
+    assert [list(chunk.columns) for chunk in chunks] == [["a", "t"], ["a", "t"]]
+    # Partial dates are left to cast:
+    partial = tmp_path / "b.csv"
+    partial.write_text("t\n2021-06\n2021-06-02\n")
+    df = sut.read_table_with_header(str(partial), True, pushdown=pushdown, sep=",")
+    assert list(df["t"]) == ["2021-06", "2021-06-02"]
+    # Names in pushdown are not positions:
+    df = sut.read_table_with_header(str(path), False, pushdown=pushdown, sep=",")
+    assert list(df.columns) == ["c1", "c2", "c3"]
+
+
+def test_read_table_parallel_with_pushdown(tmp_path):
+    path = tmp_path / "a.csv"
+    path.write_text("a,b,t\n" + "1,x,2020-01-02\n" * 10)
+    pushdown = Pushdown(columns=["t", "a"], types={"t": "datetime"})
+    df = sut.read_table_with_header(str(path), True, jobs=2, pushdown=pushdown, sep=",")
+    assert list(df.columns) == ["a", "t"]
+    assert len(df) == 10
+    assert df["t"].dtype == "datetime64[ns]"
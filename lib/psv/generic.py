@@ -1,10 +1,28 @@
+from typing import Callable, Iterator, List
+from contextlib import contextmanager
+from functools import partial
+from itertools import filterfalse, zip_longest
+from operator import methodcaller
+import codecs
+import gc
 import re
+import threading
 import pandas as pd
 from .command import section, command
 from .formats import FormatIn, FormatOut
 
 section("Format", 20)
 
+BLOCK_SIZE = 1024 * 1024
+# Record separators split on a newline,
+# with a prefix or suffix removed from each record:
+LINE_SEPARATORS = {
+    r"\n\r?": ("\n", "\r", ""),
+    r"\r?\n": ("\n", "", "\r"),
+}
+REGEX_SPECIAL = ".^$*+?{}[]|()"
+ESCAPES = {"t": "\t", "n": "\n", "r": "\r", "f": "\f", "v": "\v", "a": "\a"}
+
 ############################
 
 
@@ -47,18 +65,12 @@ class TableIn(FormatIn):
       :suffix: .txt
     """
 
-    # pylint: disable-next=too-many-locals
     def format_in(self, readable, _env):
         columns = self.opt("columns", "")
         columns = re.split(r" *, *| +", columns) if columns else []
-        skip_fn = None
+        skip = None
         if skip_rx := self.opt("skip"):
-            skip_rx = re.compile(skip_rx)
-
-            def skip_row(row):
-                return re.match(skip_rx, row)
-
-            skip_fn = skip_row
+            skip = re.compile(skip_rx).match
         return parse_rows(
             readable,
             field_sep=self.opt("fs", r"\s+"),
@@ -67,7 +79,7 @@ class TableIn(FormatIn):
             encoding=self.opt("encoding", self.default_encoding()),
             columns=columns,
             header=self.opt("header"),
-            skip=skip_fn,
+            skip=skip,
         )
 
 
@@ -139,43 +151,162 @@ def parse_rows(
     header=None,
     skip=None,
 ):
-    field_sep_rx = re.compile(field_sep)
-    record_sep_rx = re.compile(record_sep)
-    max_cols = int(max_cols or 0)
+    split = field_splitter(field_sep, int(max_cols or 0))
     columns = columns or []
     if "%" not in column_format:
         column_format += "%d"
-    max_width = 0
-    # Split content by record separator:
-    rows = readable.read()
-    if isinstance(rows, bytes) and encoding:
-        rows = rows.decode(encoding)
-    rows = re.split(record_sep_rx, rows)
-    # Remove trailing empty record:
-    if rows and rows[-1] == "":
-        rows.pop(-1)
-    # Remove invalid rows:
-    if skip:
-        rows = [row for row in rows if not skip(row)]
-    #   --keep=REGEX     |  Records matching REGEX are kept.
-    i = 0
-    for row in rows:
-        # Split row by field separator:
-        fields = re.split(field_sep_rx, row, maxsplit=max_cols)
-        max_width = max(max_width, len(fields))
-        rows[i] = fields[:]
-        i += 1
-    # Pad all rows to max row width:
-    pads = [[""] * n for n in range(max_width + 1)]
-    for row in rows:
-        row.extend(pads[max_width - len(row)])
-    # Take header off the top,
-    # otherwise: generate columns by index:
+    names = None
+    data: List[list] = []
+    count = 0
+    with gc_paused():
+        for records in read_records(readable, record_sep, encoding):
+            # Remove invalid rows:
+            if skip:
+                records = filterfalse(skip, records)
+            rows = list(map(split, records))
+            # Take header off the top:
+            if header and names is None and rows:
+                names = rows.pop(0)
+            extend_columns(data, count, rows)
+            count += len(rows)
+    # Pad to header width:
+    width = max(len(data), len(names or []))
+    data.extend([""] * count for _ in range(width - len(data)))
     if header:
-        cols = rows.pop(0)
+        names = names or []
+        cols = names + [""] * (width - len(names))
     else:
-        cols = generate_columns(columns, column_format, max_width)
-    return pd.DataFrame(columns=cols, data=rows)
+        cols = list(generate_columns(columns, column_format, width))
+    df = pd.DataFrame(dict(enumerate(data)), index=pd.RangeIndex(count))
+    df.columns = cols
+    return df
+
+
+def read_records(
+    readable, record_sep, encoding=None, block_size=BLOCK_SIZE
+) -> Iterator[List[str]]:
+    """
+    Yields the records split from each block read from readable.
+    A trailing empty record is removed.
+    """
+    if separator := LINE_SEPARATORS.get(record_sep):
+        sep, prefix, suffix = separator
+    elif sep := literal_separator(record_sep):
+        prefix = suffix = ""
+    else:
+        # Other patterns could match across blocks:
+        text = decode(readable.read(), encoding)
+        records = re.split(record_sep, text)
+        if records and records[-1] == "":
+            records.pop(-1)
+        yield records
+        return
+    decoder = codecs.getincrementaldecoder(encoding or "utf-8")()
+    tail = ""
+    first = True
+    while True:
+        data = readable.read(block_size)
+        eof = not data
+        if isinstance(data, bytes):
+            data = decoder.decode(data, final=eof)
+        records = (tail + data).split(sep)
+        # The last record may continue in the next block:
+        tail = records.pop(-1)
+        # Records are between separators:
+        if prefix:
+            start = 1 if first else 0
+            records[start:] = map(methodcaller("removeprefix", prefix), records[start:])
+        if suffix:
+            records = list(map(methodcaller("removesuffix", suffix), records))
+        if eof:
+            if prefix and (records or not first):
+                tail = tail.removeprefix(prefix)
+            if tail:
+                records.append(tail)
+            yield records
+            return
+        if records:
+            first = False
+            yield records
+
+
+@contextmanager
+def gc_paused():
+    # Lists of strings cannot form cycles;
+    # collecting while millions are allocated is slower than parsing them.
+    # GC is process-wide: other threads may allocate cycles meanwhile:
+    enabled = gc.isenabled() and threading.active_count() == 1
+    if enabled:
+        gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def decode(data, encoding) -> str:
+    if isinstance(data, bytes):
+        return data.decode(encoding or "utf-8")
+    return data
+
+
+def field_splitter(field_sep, max_cols: int) -> Callable[[str], List[str]]:
+    """
+    A function that splits a record as re.split(field_sep, record, maxsplit=max_cols).
+    Literal and whitespace separators are split by str.split.
+    """
+    if sep := literal_separator(field_sep):
+        return methodcaller("split", sep, max_cols or -1)
+    rx = re.compile(field_sep)
+    if field_sep == r"\s+":
+
+        def split_whitespace(record):
+            # str.split() does not return leading or trailing empty fields:
+            if record and not record[0].isspace() and not record[-1].isspace():
+                return record.split(None, max_cols or -1)
+            return rx.split(record, max_cols)
+
+        return split_whitespace
+    return partial(rx.split, maxsplit=max_cols)
+
+
+def literal_separator(pattern) -> str | None:
+    """
+    The string that pattern matches, if pattern has no special characters.
+    """
+    chars = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            if char.isalnum():
+                if char not in ESCAPES:
+                    return None
+                char = ESCAPES[char]
+            chars.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in REGEX_SPECIAL:
+            return None
+        else:
+            chars.append(char)
+    if escaped or not chars:
+        return None
+    return "".join(chars)
+
+
+def extend_columns(data: List[list], count: int, rows: List[List[str]]) -> None:
+    """
+    Appends the fields of rows to the lists of each column.
+    Missing fields are "".
+    """
+    for i, values in enumerate(zip_longest(*rows, fillvalue="")):
+        if i == len(data):
+            data.append([""] * count)
+        data[i].extend(values)
+    for column in data:
+        column.extend([""] * (count + len(rows) - len(column)))
 
 
 def generate_columns(columns, column_format, width):
@@ -0,0 +1,82 @@
+from io import BytesIO, StringIO
+import gc
+import re
+import threading
+import pytest
+import psv.generic as sut
+
+TEXT = "a b\n\r  c\td \n\nx:y::z\r\n\r\n:é ü\n\r"
+
+
+def split_records(text, record_sep):
+    records = re.split(record_sep, text)
+    if records and records[-1] == "":
+        records.pop(-1)
+    return records
+
+
+@pytest.mark.parametrize("record_sep", [r"\n\r?", r"\r?\n", r"\n", r"\r\n", "[\n:]"])
+@pytest.mark.parametrize("block_size", [1, 2, 3, 1024])
+def test_read_records(record_sep, block_size):
+    for text in [TEXT, TEXT + "tail", "", "\r\n", "\n"]:
+        readable = BytesIO(text.encode("utf-8"))
+        records = sut.read_records(readable, record_sep, "utf-8", block_size)
+        assert [r for rs in records for r in rs] == split_records(text, record_sep)
+
+
+@pytest.mark.parametrize("field_sep", [r"\s+", ":", r"\t", "::", r"\:", r"\s{2,}"])
+@pytest.mark.parametrize("max_cols", [0, 1, 2])
+def test_field_splitter(field_sep, max_cols):
+    split = sut.field_splitter(field_sep, max_cols)
+    for record in split_records(TEXT, r"\n\r?") + ["", " ", " a ", "a :b"]:
+        assert split(record) == re.split(field_sep, record, maxsplit=max_cols)
+
+
+def test_literal_separator():
+    assert sut.literal_separator(":") == ":"
+    assert sut.literal_separator(r"\t") == "\t"
+    assert sut.literal_separator(r"\|") == "|"
+    assert sut.literal_separator(r"\s+") is None
+    assert sut.literal_separator("a|b") is None
+    assert sut.literal_separator("") is None
+
+
+def test_parse_rows():
+    text = "#skip\nlogin:x:uid\nroot:x:0\nbin:x:1:1:extra\n"
+    df = sut.parse_rows(
+        StringIO(text),
+        field_sep=":",
+        record_sep=r"\n\r?",
+        header=True,
+        skip=re.compile("#").match,
+    )
+    assert list(df.columns) == ["login", "x", "uid", "", ""]
+    assert df.values.tolist() == [
+        ["root", "x", "0", "", ""],
+        ["bin", "x", "1", "1", "extra"],
+    ]
+    df = sut.parse_rows(
+        BytesIO(b"a  b c\n d\n"),
+        field_sep=r"\s+",
+        record_sep=r"\n\r?",
+        max_cols=1,
+        columns=["x"],
+        encoding="utf-8",
+    )
+    assert list(df.columns) == ["x", "c2"]
+    assert df.values.tolist() == [["a", "b c"], ["", "d"]]
+
+
+def test_gc_paused():
+    with sut.gc_paused():
+        assert not gc.isenabled()
+    assert gc.isenabled()
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        with sut.gc_paused():
+            assert gc.isenabled()
+    finally:
+        stop.set()
+        thread.join()
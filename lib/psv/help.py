@@ -29,6 +29,9 @@ class Help(Command):
     --markdown      |  Emit Markdown.
     """
 
+    def is_cacheable(self) -> bool:
+        return False
+
     def xform(self, _inp, env):
         tabulate.PRESERVE_WHITESPACE = True
 
@@ -0,0 +1,144 @@
+from typing import Any, Callable
+from email.utils import parsedate_to_datetime
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from .cache import evict_lru
+
+DEFAULT_HTTP_CACHE_DIR = "~/.psv/http-cache"
+DEFAULT_HTTP_CACHE_SIZE = 1024 * 1024 * 1024
+BODY_SUFFIX = ".body"
+META_SUFFIX = ".json"
+
+# fetch(headers) -> response, with .status, .headers and .read():
+Fetch = Callable[[dict], Any]
+
+
+class HttpCache:
+    """
+    Stores HTTP GET response bodies on disk.
+
+    Responses are fresh until the expiration given by Cache-Control max-age or Expires.
+    Stale responses are revalidated with If-None-Match and If-Modified-Since:
+    on 304 Not Modified, the stored body is used.
+    Responses with Cache-Control no-store are not stored.
+    Bodies are removed least-recently used first,
+    when their total size exceeds max_size bytes.
+    """
+
+    def __init__(self, directory: str | None = None, max_size: int | None = None):
+        self.directory = os.path.expanduser(
+            directory or os.environ.get("PSV_HTTP_CACHE_DIR") or DEFAULT_HTTP_CACHE_DIR
+        )
+        self.max_size = max_size or int(
+            os.environ.get("PSV_HTTP_CACHE_SIZE") or DEFAULT_HTTP_CACHE_SIZE
+        )
+
+    def get(self, url: str, fetch: Fetch):
+        """
+        Returns a readable of the body for url.
+        """
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        meta = self.read_meta(key)
+        if meta and meta["expires"] > time.time():
+            return self.open_body(key)
+        response = fetch(conditional_headers(meta))
+        if meta and response.status == 304:
+            response.close()
+            meta["expires"] = expiration(response.headers, time.time())
+            self.write_meta(key, meta)
+            return self.open_body(key)
+        if response.status != 200:
+            raise Exception(f"GET {url} : status {response.status}")
+        if "no-store" in cache_control(response.headers):
+            return response
+        self.write_body(key, response)
+        self.write_meta(
+            key,
+            {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "expires": expiration(response.headers, time.time()),
+            },
+        )
+        # A body larger than max_size is read before it is removed:
+        readable = self.open_body(key)
+        self.evict()
+        return readable
+
+    def read_meta(self, key: str) -> dict | None:
+        try:
+            with open(self.path(key, META_SUFFIX), encoding="utf-8") as io:
+                meta = json.load(io)
+            if os.path.exists(self.path(key, BODY_SUFFIX)):
+                return meta
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def write_meta(self, key: str, meta: dict) -> None:
+        with open(self.path(key, META_SUFFIX), "w", encoding="utf-8") as io:
+            json.dump(meta, io)
+
+    def write_body(self, key: str, response) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as io:
+                shutil.copyfileobj(response, io)
+            os.replace(tmp, self.path(key, BODY_SUFFIX))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        finally:
+            response.close()
+
+    def open_body(self, key: str):
+        path = self.path(key, BODY_SUFFIX)
+        # Mark as recently used:
+        os.utime(path)
+        return open(path, "rb")
+
+    def evict(self) -> None:
+        evict_lru(self.directory, self.max_size, BODY_SUFFIX, related=[META_SUFFIX])
+
+    def path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key + suffix)
+
+
+def conditional_headers(meta: dict | None) -> dict:
+    headers = {}
+    if meta and meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta and meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def cache_control(headers) -> dict:
+    directives = {}
+    for directive in re.split(r"\s*,\s*", headers.get("Cache-Control") or ""):
+        if directive:
+            name, _, value = directive.partition("=")
+            directives[name.strip().lower()] = value.strip('"')
+    return directives
+
+
+def expiration(headers, now: float) -> float:
+    # Stale responses are always revalidated:
+    directives = cache_control(headers)
+    if "no-cache" in directives:
+        return 0.0
+    if re.match(r"^\d+$", directives.get("max-age", "")):
+        return now + int(directives["max-age"])
+    if expires := headers.get("Expires"):
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+    return 0.0
@@ -0,0 +1,85 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+import urllib3
+import pytest
+import psv.http_cache as sut
+
+
+class Handler(BaseHTTPRequestHandler):
+    body = b"a\tb\n1\t2\n"
+    cache_control = "no-cache"
+    requests: list = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        Handler.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Cache-Control", Handler.cache_control)
+        self.send_header("Content-Length", str(len(Handler.body)))
+        self.end_headers()
+        self.wfile.write(Handler.body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture(name="url")
+def fixture_url():
+    Handler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/a.tsv"
+    server.shutdown()
+    server.server_close()
+
+
+def fetcher(url):
+    def fetch(headers):
+        return urllib3.PoolManager().request(
+            "GET", url, headers=headers, preload_content=False
+        )
+
+    return fetch
+
+
+def get(cache, url):
+    with cache.get(url, fetcher(url)) as readable:
+        return readable.read()
+
+
+def test_revalidate(tmp_path, url):
+    cache = sut.HttpCache(directory=str(tmp_path))
+    assert get(cache, url) == Handler.body
+    assert get(cache, url) == Handler.body
+    assert len(Handler.requests) == 2
+    assert "If-None-Match" not in Handler.requests[0]
+    assert Handler.requests[1]["If-None-Match"] == '"v1"'
+
+
+def test_max_age(tmp_path, url):
+    Handler.cache_control = "max-age=60"
+    try:
+        cache = sut.HttpCache(directory=str(tmp_path))
+        assert get(cache, url) == Handler.body
+        assert get(cache, url) == Handler.body
+        assert len(Handler.requests) == 1
+    finally:
+        Handler.cache_control = "no-cache"
+
+
+def test_evict(tmp_path, url):
+    cache = sut.HttpCache(directory=str(tmp_path), max_size=1)
+    assert get(cache, url) == Handler.body
+    assert not list(tmp_path.iterdir())
+
+
+def test_expiration():
+    fut = sut.expiration
+    assert fut({"Cache-Control": "max-age=10"}, 100.0) == 110.0
+    assert fut({"Cache-Control": "no-cache, max-age=10"}, 100.0) == 0.0
+    assert fut({"Expires": "Thu, 01 Jan 1970 00:01:40 GMT"}, 0.0) == 100.0
+    assert fut({}, 100.0) == 0.0
@@ -0,0 +1,102 @@
+from typing import Any, List
+from dataclasses import dataclass, asdict
+from contextlib import contextmanager
+import resource
+import sys
+import time
+import pandas as pd
+from .chunks import Chunks
+
+
+@dataclass
+class StageStats:
+    """
+    Resources used by one pipeline stage.
+    Times exclude time spent in upstream stages.
+    max_rss is the maximum resident memory of the process, in bytes,
+    when the stage last ran: it includes earlier stages and never decreases.
+    """
+
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    rows_in: int | None = None
+    rows_out: int | None = None
+    bytes_out: int | None = None
+    max_rss: int = 0
+
+    def to_dict(self):
+        return asdict(self)
+
+
+class StageClock:
+    """
+    Measures StageStats for nested stages.
+    Chunks are pulled through all upstream stages:
+    time spent in a nested measure() is subtracted from the enclosing one.
+    """
+
+    def __init__(self):
+        self.nested: List[List[float]] = []
+
+    @contextmanager
+    def measure(self, stats: StageStats):
+        self.nested.append([0.0, 0.0])
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield stats
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            nested_wall, nested_cpu = self.nested.pop()
+            stats.wall_time += wall - nested_wall
+            stats.cpu_time += cpu - nested_cpu
+            stats.max_rss = max(stats.max_rss, max_rss())
+            if self.nested:
+                self.nested[-1][0] += wall
+                self.nested[-1][1] += cpu
+
+    def instrument(self, output: Any, stats: StageStats) -> Any:
+        if isinstance(output, Chunks):
+            return self.instrument_chunks(output, stats)
+        stats.rows_out = count_rows(output)
+        stats.bytes_out = count_bytes(output)
+        return output
+
+    def instrument_chunks(self, chunks: Chunks, stats: StageStats) -> Chunks:
+        stats.rows_out = stats.bytes_out = 0
+
+        def measured_chunks():
+            iterator = iter(chunks)
+            try:
+                while True:
+                    with self.measure(stats):
+                        chunk = next(iterator, None)
+                    if chunk is None:
+                        break
+                    stats.rows_out += len(chunk)
+                    stats.bytes_out += count_bytes(chunk)
+                    yield chunk
+            finally:
+                chunks.close()
+
+        return Chunks(measured_chunks())
+
+
+def count_rows(datum) -> int | None:
+    if isinstance(datum, pd.DataFrame):
+        return len(datum)
+    return None
+
+
+def count_bytes(datum) -> int | None:
+    if isinstance(datum, pd.DataFrame):
+        return int(datum.memory_usage(index=True, deep=False).sum())
+    if isinstance(datum, (str, bytes)):
+        return len(datum)
+    return None
+
+
+def max_rss() -> int:
+    # ru_maxrss is KiB on Linux, bytes on macOS:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
@@ -0,0 +1,27 @@
+import pandas as pd
+from psv.chunks import Chunks
+from psv.instrument import StageClock, StageStats
+
+
+def test_instrument_dataframe():
+    clock, stats = StageClock(), StageStats()
+    with clock.measure(stats):
+        df = pd.DataFrame({"a": [1, 2, 3]})
+    assert clock.instrument(df, stats) is df
+    assert stats.rows_out == 3
+    assert stats.bytes_out > 0
+    assert stats.wall_time >= 0
+    assert stats.max_rss > 0
+
+
+def test_instrument_chunks():
+    clock = StageClock()
+    upstream, downstream = StageStats(), StageStats()
+    chunks = Chunks([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})])
+    chunks = clock.instrument(chunks, upstream)
+    chunks = clock.instrument(chunks.map(lambda df: df[df["a"] > 1]), downstream)
+    with clock.measure(StageStats()):
+        result = chunks.concat()
+    assert list(result["a"]) == [2, 3]
+    assert upstream.rows_out == 3
+    assert downstream.rows_out == 2
@@ -1,12 +1,33 @@
+from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from io import TextIOWrapper
+import glob
 import json
+import os
+import re
+import time
 import pandas as pd
 from devdriven.to_dict import to_dict
+from devdriven.user_agent import UserAgent
 from .content import Content
+from .http_cache import HttpCache
 from .command import Command, command, section, find_format
-from .formats import FormatIn
+from .formats import FormatIn, FormattedOutput
+from .chunks import Chunks
+from .pushdown import Pushdown
+from .compression import (
+    MAGIC_SIZE,
+    compress,
+    compress_writable,
+    compression_for_path,
+    sniff_compression,
+)
 
 section("I/O", 10)
 
+# Seconds before the first retry of a failed write, doubled for each retry:
+RETRY_DELAY = 0.5
+
 
 class IoBase(Command):
     def user_agent_headers(self, env):
@@ -21,14 +42,22 @@ class IoIn(IoBase):
     Aliases: i, -i
 
     If no arguments are given, read from STDIN.
+    Multiple files are parsed by --jobs threads.
+    CSV and TSV files are each parsed by --parse-jobs processes.
 
     FILE             |  Read FILE.
+    FILE ...         |  Read and concatenate FILEs.
+    GLOB             |  Read files matching GLOB, e.g. 'logs/*.csv'.
     file:///FILE     |  Read FILE.
     https?://URL     |  GET URL.
     -                |  Read STDIN.
 
     --auto, -a       |  Attempt to infer format from suffix.
     --raw, -r        |  Do not attempt infer format.
+    --chunk-size=ROWS  |  Stream rows in chunks of ROWS.
+    --jobs=N         |  Parse multiple files with N threads.  Default: number of CPUs.
+    --source-column=NAME  |  Add a column NAME with the path of each file.
+    --http-cache     |  Cache HTTP responses in $PSV_HTTP_CACHE_DIR.  Default: if it is set.
 
     # in: read from STDIN:
     $ cat a.tsv | psv in -
@@ -37,32 +66,122 @@ class IoIn(IoBase):
     # in: HTTP support:
     $ psv in https://tinyurl.com/4sscj338
 
+    # in: read multiple files:
+    $ psv in --source-column=file 'us-states*.csv' // count file // md
+
     :section: I/O
     """
 
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Set by Pipeline: see pushdown.py.
+        self.pushdown = Pushdown()
+
+    def is_reader(self) -> bool:
+        return True
+
     def xform(self, _inp, env):
         if not self.args:
             self.args.append("-")
-        env["input.paths"] = [self.args[0]]
-        content = Content(
-            url=self.args[0], stdin=self.main.stdin, stdout=self.main.stdout
-        )
+        paths = expand_paths(self.args)
+        env["input.paths"] = paths
+        if len(paths) == 1 and not self.opt("source-column"):
+            return self.read_input(paths[0], env)
+        return self.read_inputs(paths, env)
+
+    def read_input(self, path, env):
+        content = self.make_content(path)
         infer = True
         infer = infer or self.opt("auto", False)
         infer = infer and not self.next_xform_is_format_in(env)
         infer = infer and not self.opt("raw", False) and not content.is_stdio()
-        format_for_suffix = infer and find_format(self.args[0], FormatIn)
+        format_for_suffix = infer and find_format(path, FormatIn)
         if infer and format_for_suffix:
-            xform = format_for_suffix()
-            xform.main = self.main
-            xform.opts = self.opts
-            content = xform(content, env)
+            content = self.parse_input(format_for_suffix, content, env)
         return content
 
+    def read_inputs(self, paths, env):
+        # Each file is parsed by the next command, if it is a format,
+        # otherwise by the format for its suffix:
+        format_in = env["xform"]["next"]
+        if not self.next_xform_is_format_in(env):
+            format_in = None
+
+        def read(path):
+            content = self.make_content(path)
+            if format_in:
+                frame = self.parse_input(type(format_in), content, env, format_in.opts)
+            elif self.opt("raw", False) or not (klass := find_format(path, FormatIn)):
+                raise Exception(f"in: cannot infer format of {path!r}")
+            else:
+                frame = self.parse_input(klass, content, env)
+            if col := self.opt("source-column"):
+                frame = add_source_column(frame, col, path)
+            return frame
+
+        env["Content-Type"] = "application/x-pandas-dataframe"
+        env["Content-Encoding"] = None
+        # Streamed files are opened one at a time:
+        if self.opt("chunk-size", env.get("input.chunk_size")):
+            return Chunks(chain_chunks(map(read, paths)))
+        jobs = int(self.opt("jobs", 0)) or min(len(paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            frames = list(executor.map(read, paths))
+        return pd.concat(frames, ignore_index=True)
+
+    def parse_input(self, klass, content, env, opts=None):
+        xform = klass()
+        xform.main = self.main
+        xform.opts = self.opts if opts is None else opts
+        xform.pushdown = self.pushdown
+        return xform(content, env)
+
+    def make_content(self, path):
+        content = Content(url=path, stdin=self.main.stdin, stdout=self.main.stdout)
+        if self.opt("http-cache", bool(os.environ.get("PSV_HTTP_CACHE_DIR"))):
+            content.http_cache = HttpCache()
+        return content
+
+    def input_identity(self):
+        # Identifies all inputs, None if any cannot be identified:
+        contents = [
+            self.make_content(path)
+            for path in expand_paths(self.args or ["-"])
+        ]
+        identities = [content.identity() for content in contents]
+        return None if None in identities else identities
+
     def next_xform_is_format_in(self, env: dict):
         return issubclass(type(env["xform"]["next"]), FormatIn)
 
 
+def expand_paths(args: List[str]) -> List[str]:
+    paths = []
+    for arg in args:
+        if "://" not in arg and re.search(r"[*?\[]", arg):
+            paths.extend(sorted(glob.glob(arg)) or [arg])
+        else:
+            paths.append(arg)
+    return paths
+
+
+def add_source_column(frame, col, path):
+    if isinstance(frame, Chunks):
+        return frame.map(lambda chunk: chunk.assign(**{col: path}))
+    return frame.assign(**{col: path})
+
+
+def chain_chunks(frames):
+    for frame in frames:
+        if isinstance(frame, Chunks):
+            try:
+                yield from frame
+            finally:
+                frame.close()
+        else:
+            yield frame
+
+
 @command
 class IoOut(IoBase):
     """
@@ -77,6 +196,8 @@ class IoOut(IoBase):
     -                |  Write STDOUT.
 
     --encoding=ENC     |  Use encoding.  Default: 'UTF-8'.
+    --jobs=N           |  Write multiple URLs with N threads.  Default: one for each.
+    --retries=N        |  Retry failed writes N times.  Default: 0.
 
     # out: Convert TSV to CSV and save to a file:
     $ psv in a.tsv // -tsv // csv- // out a.csv
@@ -84,6 +205,9 @@ class IoOut(IoBase):
     :section: I/O
     """
 
+    def is_cacheable(self) -> bool:
+        return False
+
     def xform(self, inp, env):
         if inp is None:
             return None
@@ -93,7 +217,13 @@ class IoOut(IoBase):
         env["output.paths"] = list(map(str, self.args))
         # ???: handle encoding header?
         headers = self.user_agent_headers(env)
-        # ???: implement streaming:
+        if isinstance(inp, FormattedOutput):
+            if len(self.args) == 1 and self.write_formatted(
+                inp, self.args[0], encoding
+            ):
+                return inp
+            # Each URL gets the same body:
+            inp = inp.getvalue()
         if isinstance(inp, str):
             body = inp.encode(encoding)
         elif isinstance(inp, bytes):
@@ -103,9 +233,84 @@ class IoOut(IoBase):
         elif isinstance(inp, pd.DataFrame):
             body = (str(inp) + "\n").encode(encoding)
         else:
-            body = json.dumps(to_dict(inp), indent=2)
-        for uri in self.args:
-            Content(url=uri, stdin=self.main.stdin, stdout=self.main.stdout).put(
-                body, headers=headers
-            )
+            body = json.dumps(to_dict(inp), indent=2).encode(encoding)
+        self.put_all(body, headers)
         return inp
+
+    def put_all(self, body, headers):
+        # URLs are written concurrently, through one connection pool.
+        # Errors are reported for each URL, after all are attempted:
+        user_agent = UserAgent()
+        retries = int(self.opt("retries", 0))
+
+        def put(uri):
+            content = Content(url=uri, stdin=self.main.stdin, stdout=self.main.stdout)
+            content.user_agent = user_agent
+            for attempt in range(retries + 1):
+                try:
+                    content.put(compress_body(body, content.url.path), headers=headers)
+                    return None
+                # pylint: disable-next=broad-except
+                except Exception as exc:
+                    if attempt == retries:
+                        return f"{uri}: {exc}"
+                    time.sleep(RETRY_DELAY * 2**attempt)
+            return None
+
+        jobs = int(self.opt("jobs", 0)) or len(self.args)
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            errors = [error for error in executor.map(put, self.args) if error]
+        for error in errors:
+            self.log("error", "out: %s", error)
+        if errors:
+            raise Exception(f"out: {len(errors)} of {len(self.args)} writes failed")
+
+    def write_formatted(self, output, uri, encoding) -> bool:
+        # Formats directly to a file or STDOUT.
+        # Other URLs are written with the formatted body.
+        content = Content(url=uri, stdin=self.main.stdin, stdout=self.main.stdout)
+        if content.is_stdio():
+            stdout = self.main.stdout
+            stdout.flush()
+            if not (buffer := getattr(stdout, "buffer", None)):
+                if output.is_binary():
+                    return False
+                output.write_to(stdout)
+                return True
+            write_output(output, buffer, encoding)
+            buffer.flush()
+            return True
+        if content.is_file():
+            compression = compression_for_path(content.url.path)
+            # Binary formats may compress their own output:
+            if compression and output.is_binary():
+                return False
+            with open(content.url.path, "wb") as writable:
+                if compression:
+                    with compress_writable(writable, compression) as compressed:
+                        write_output(output, compressed, encoding)
+                else:
+                    write_output(output, writable, encoding)
+            return True
+        return False
+
+
+def write_output(output, writable, encoding):
+    # Text is encoded as it is written:
+    if output.is_binary():
+        output.write_to(writable)
+        return
+    text = TextIOWrapper(writable, encoding=encoding, newline="")
+    try:
+        output.write_to(text)
+    finally:
+        text.flush()
+        text.detach()
+
+
+def compress_body(body: bytes, path: str) -> bytes:
+    # Compress by suffix, unless already compressed:
+    compression = compression_for_path(path)
+    if not compression or sniff_compression(body[:MAGIC_SIZE]) == compression:
+        return body
+    return compress(body, compression)
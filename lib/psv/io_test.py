@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+import pytest
+import psv.io as sut
+
+
+def test_expand_paths(tmp_path):
+    for name in ["b.csv", "a.csv", "c.tsv"]:
+        (tmp_path / name).write_text("x\n1\n")
+    assert sut.expand_paths([f"{tmp_path}/*.csv", "-"]) == [
+        f"{tmp_path}/a.csv",
+        f"{tmp_path}/b.csv",
+        "-",
+    ]
+    assert sut.expand_paths([f"{tmp_path}/*.none"]) == [f"{tmp_path}/*.none"]
+    assert sut.expand_paths(["https://x/?a=*"]) == ["https://x/?a=*"]
+
+
+def test_put_all(monkeypatch):
+    attempts = []
+
+    def put(content, body, headers=None):
+        attempts.append((content.url.path, body, headers))
+        if content.url.path == "/bad" or len(attempts) == 1:
+            raise Exception("unavailable")
+        return content
+
+    monkeypatch.setattr(sut.Content, "put", put)
+    monkeypatch.setattr(sut, "RETRY_DELAY", 0)
+    xform = sut.IoOut()
+    xform.main = SimpleNamespace(stdin=None, stdout=None)
+    xform.opts = {"retries": 1, "jobs": 1}
+    xform.args = ["http://a/ok", "http://b/bad"]
+    errors = []
+    xform.log = lambda _level, _fmt, error: errors.append(error)
+    with pytest.raises(Exception, match="1 of 2 writes failed"):
+        xform.put_all(b"body", {})
+    assert errors == ["http://b/bad: unavailable"]
+    assert len(attempts) == 4
+
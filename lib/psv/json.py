@@ -1,7 +1,9 @@
 import json
 import pandas as pd
 from .command import section, command
+from .chunks import Chunks, DEFAULT_CHUNK_SIZE
 from .formats import FormatIn, FormatOut
+from .json_stream import read_json_array_chunks
 
 section("Format", 20)
 
@@ -12,7 +14,13 @@ class JsonIn(FormatIn):
       json-in - Parse JSON.
       aliases: -json, -js
 
-      --orient=ORIENT  |  Orientation: see pandas read_json.
+      --orient=ORIENT     |  Orientation: see pandas read_json.
+      --stream            |  Decode array elements incrementally, as KEY.KEY columns.
+      --path=KEY.KEY...   |  Stream the array at the path of object keys.
+      --chunk-size=ROWS   |  Stream rows in chunks of ROWS.
+
+    # Decode array elements incrementally:
+    $ psv in a.json // -json --stream // md
 
     # Convert JSON to Markdown:
     # $ psv in a.json // -json // md
@@ -20,10 +28,31 @@ class JsonIn(FormatIn):
       :suffixes: .json
     """
 
-    def format_in(self, readable, _env):
+    def wants_input_file(self):
+        return True
+
+    def format_in(self, readable, env):
+        if self.streams():
+            return self.format_in_chunks(readable, env, DEFAULT_CHUNK_SIZE).concat()
         orient = self.opt("orient", "records")
         return pd.read_json(readable, orient=orient, convert_dates=True)
 
+    def format_in_chunks(self, readable, env, chunk_size):
+        if not self.streams():
+            return super().format_in_chunks(readable, env, chunk_size)
+        path = self.opt("path")
+        path = path.split(".") if path else None
+        # Each chunk has the keys of its elements, in their order:
+        if isinstance(readable, str):
+            # pylint: disable-next=consider-using-with
+            io = open(readable, "rb")
+            chunks = Chunks(read_json_array_chunks(io, chunk_size, path))
+            return chunks.aligned().closing(io)
+        return Chunks(read_json_array_chunks(readable, chunk_size, path)).aligned()
+
+    def streams(self) -> bool:
+        return bool(self.opt("stream", False) or self.opt("path"))
+
 
 @command
 class JsonOut(FormatOut):
@@ -31,6 +60,8 @@ class JsonOut(FormatOut):
       json-out - Generate JSON array of objects.
       aliases: json-, json, js-, js
 
+      --compact  |  Do not indent.
+
     # Convert CSV to JSON:
     $ psv in a.csv // -csv // json- // o a.json -
 
@@ -38,12 +69,81 @@ class JsonOut(FormatOut):
     """
 
     def format_out(self, inp, _env, writeable):
+        indent = None if self.opt("compact", False) else 2
         if isinstance(inp, pd.DataFrame):
             orient = self.opt("orient", "records")
             inp.to_json(
-                writeable, orient=orient, date_format="iso", index=False, indent=2
+                writeable, orient=orient, date_format="iso", index=False, indent=indent
             )
         else:
-            json.dump(inp, writeable, indent=2)
+            json.dump(inp, writeable, indent=indent)
         # to_json doesn't terminate last line:
         writeable.write("\n")
+
+
+@command
+class JsonlIn(FormatIn):
+    """
+      jsonl-in - Parse JSON Lines (NDJSON): one JSON object per line.
+      aliases: -jsonl, -ndjson
+
+      --chunk-size=ROWS   |  Stream rows in chunks of ROWS.
+
+    # Convert JSON Lines to Markdown:
+    $ psv in a.csv // -csv // jsonl- // o /tmp/a.jsonl
+    $ psv in /tmp/a.jsonl // -jsonl // md
+
+      :suffixes: .jsonl, .ndjson
+    """
+
+    def wants_input_file(self):
+        return True
+
+    def format_in(self, readable, _env):
+        return pd.read_json(readable, lines=True, convert_dates=True)
+
+    def format_in_chunks(self, readable, _env, chunk_size):
+        # Each chunk has the keys of its lines, in their order:
+        return Chunks(read_json_lines_chunks(readable, chunk_size)).aligned()
+
+
+@command
+class JsonlOut(FormatOut):
+    """
+      jsonl-out - Generate JSON Lines (NDJSON): one JSON object per line.
+      aliases: jsonl-, jsonl, ndjson-
+
+    # Convert CSV to JSON Lines:
+    $ psv in a.csv // -csv // jsonl- // o /tmp/a.jsonl -
+
+      :suffixes: .jsonl, .ndjson
+    """
+
+    def is_row_local(self):
+        return True
+
+    def setup_env(self, inp, env):
+        super().setup_env(inp, env)
+        env["Content-Type"] = "application/x-ndjson"
+
+    def format_out(self, inp, _env, writeable):
+        if isinstance(inp, pd.DataFrame):
+            # to_json terminates each line:
+            inp.to_json(
+                writeable, orient="records", lines=True, date_format="iso", index=False
+            )
+        else:
+            for item in inp if isinstance(inp, list) else [inp]:
+                json.dump(item, writeable)
+                writeable.write("\n")
+
+    def format_out_chunks(self, chunks, env, writeable):
+        for chunk in chunks:
+            self.format_out(chunk, env, writeable)
+
+
+def read_json_lines_chunks(readable, chunk_size):
+    with pd.read_json(
+        readable, lines=True, convert_dates=True, chunksize=chunk_size
+    ) as reader:
+        yield from reader
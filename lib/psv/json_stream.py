@@ -0,0 +1,124 @@
+from typing import Any, Iterator, List
+import codecs
+import json
+import re
+import pandas as pd
+
+BLOCK_SIZE = 1024 * 1024
+WHITESPACE_RX = re.compile(r"[ \t\n\r]*")
+# Characters that continue a number, and "" at the end of the buffer:
+NUMBER_CHARS = ("", *"0123456789.eE+-")
+
+
+class JsonArrayReader:
+    """
+    Decodes the elements of a JSON array one at a time,
+    reading the document in blocks.
+
+    The array is the document, or the value at a path of object keys.
+    Only one element, and the block it ends in, are held in memory.
+    """
+
+    def __init__(self, readable, block_size: int = BLOCK_SIZE):
+        self.readable = readable
+        self.block_size = block_size
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def elements(self, path: List[str] | None = None) -> Iterator[Any]:
+        for key in path or []:
+            self.find_key(key)
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.decode_value()
+            if self.expect(",]") == "]":
+                return
+
+    def find_key(self, key: str) -> None:
+        # Skips values of other keys of the current object:
+        self.expect("{")
+        if self.peek() != "}":
+            while True:
+                name = self.decode_value()
+                self.expect(":")
+                if name == key:
+                    return
+                self.decode_value()
+                if self.expect(",}") == "}":
+                    break
+        raise Exception(f"json: key {key!r} not found")
+
+    def decode_value(self) -> Any:
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A number at the end of the buffer may continue in the next block:
+                if self.eof or self.buf[end : end + 1] not in NUMBER_CHARS:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.read_block()
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            context = self.buf[self.pos : self.pos + 20]
+            raise Exception(f"json: expected one of {chars!r} : {context!r}")
+        self.pos += 1
+        return char
+
+    def peek(self) -> str:
+        self.skip_whitespace()
+        return self.buf[self.pos : self.pos + 1]
+
+    def skip_whitespace(self) -> None:
+        while True:
+            self.pos = WHITESPACE_RX.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or self.eof:
+                return
+            self.read_block()
+
+    def read_block(self) -> None:
+        data = self.readable.read(self.block_size)
+        self.eof = not data
+        if isinstance(data, bytes):
+            data = self.text_decoder.decode(data, final=self.eof)
+        # Drop what was decoded:
+        self.buf = self.buf[self.pos :] + data
+        self.pos = 0
+
+
+def read_json_array_chunks(
+    readable, chunk_size: int, path: List[str] | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    DataFrames of chunk_size elements of a JSON array.
+    Nested objects are flattened into columns named KEY.KEY.
+    """
+    elements = JsonArrayReader(readable).elements(path)
+    start = 0
+    while True:
+        records = [record for _, record in zip(range(chunk_size), elements)]
+        if not records and start:
+            return
+        frame = records_frame(records)
+        frame.index = pd.RangeIndex(start, start + len(frame))
+        start += len(frame)
+        yield frame
+        if len(records) < chunk_size:
+            return
+
+
+def records_frame(records: List[Any]) -> pd.DataFrame:
+    if all(isinstance(record, dict) for record in records):
+        return pd.json_normalize(records, sep=".")
+    return pd.DataFrame(records)
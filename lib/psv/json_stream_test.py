@@ -0,0 +1,37 @@
+from io import BytesIO, StringIO
+import pytest
+import psv.json_stream as sut
+
+DOC = """
+{"meta": {"n": [1, 2]}, "data": {"skip": "x", "items": [
+  {"id": 1, "user": {"name": "é", "tags": ["a"]}},
+  {"id": 22, "user": {"name": "b"}},
+  {"id": 333}
+]}}
+"""
+
+
+def test_elements():
+    for block_size in [1, 2, 7, 1024]:
+        reader = sut.JsonArrayReader(BytesIO(DOC.encode("utf-8")), block_size)
+        assert [item["id"] for item in reader.elements(["data", "items"])] == [1, 22, 333]
+    reader = sut.JsonArrayReader(StringIO(" [ 12 , 3.5e2,null,[]]"), 3)
+    assert list(reader.elements()) == [12, 350.0, None, []]
+    assert list(sut.JsonArrayReader(StringIO("[]")).elements()) == []
+
+
+def test_elements_errors():
+    with pytest.raises(Exception, match="key 'x' not found"):
+        list(sut.JsonArrayReader(StringIO('{"a": 1}')).elements(["x"]))
+    with pytest.raises(Exception, match="expected one of"):
+        list(sut.JsonArrayReader(StringIO("[1 2]")).elements())
+
+
+def test_read_json_array_chunks():
+    chunks = sut.read_json_array_chunks(
+        BytesIO(DOC.encode("utf-8")), 2, ["data", "items"]
+    )
+    frames = list(chunks)
+    assert [list(frame.index) for frame in frames] == [[0, 1], [2]]
+    assert list(frames[0].columns) == ["id", "user.name", "user.tags"]
+    assert frames[0]["user.name"].tolist() == ["é", "b"]
@@ -0,0 +1,68 @@
+from io import StringIO
+import pandas as pd
+from psv.chunks import Chunks
+import psv.json as sut
+
+LINES = '{"a":1,"b":"x"}\n{"a":2,"b":"y"}\n{"a":3,"b":null}\n'
+
+
+def test_jsonl_in(tmp_path):
+    path = tmp_path / "a.jsonl"
+    path.write_text(LINES)
+    df = sut.JsonlIn().format_in(str(path), {})
+    assert df.to_dict("list") == {"a": [1, 2, 3], "b": ["x", "y", None]}
+    chunks = sut.JsonlIn().format_in_chunks(str(path), {}, 2)
+    frames = list(chunks)
+    assert [list(frame.index) for frame in frames] == [[0, 1], [2]]
+
+
+def test_jsonl_in_chunks_align_columns(tmp_path):
+    path = tmp_path / "a.jsonl"
+    path.write_text('{"a":1,"b":2}\n{"b":3,"a":4}\n{"c":9}\n')
+    frames = list(sut.JsonlIn().format_in_chunks(str(path), {}, 1))
+    assert [list(frame.columns) for frame in frames] == [
+        ["a", "b"],
+        ["a", "b"],
+        ["a", "b", "c"],
+    ]
+    assert [frame["a"].tolist() for frame in frames[:2]] == [[1], [4]]
+
+
+def test_jsonl_out():
+    out = StringIO()
+    xform = sut.JsonlOut()
+    chunks = Chunks(sut.read_json_lines_chunks(StringIO(LINES), 2))
+    xform.format_out_chunks(chunks, {}, out)
+    assert out.getvalue() == LINES
+    out = StringIO()
+    xform.format_out([{"a": 1}, [2]], {}, out)
+    assert out.getvalue() == '{"a": 1}\n[2]\n'
+
+
+def test_json_out_compact():
+    xform = sut.JsonOut()
+    xform.opts = {"compact": True}
+    out = StringIO()
+    xform.format_out(pd.DataFrame({"a": [1, 2]}), {}, out)
+    assert out.getvalue() == '[{"a":1},{"a":2}]\n'
+
+
+def test_json_in_path(tmp_path):
+    path = tmp_path / "a.json"
+    path.write_text('{"data": [{"a": {"b": 1}}, {"a": {"b": 2}}]}')
+    xform = sut.JsonIn()
+    xform.opts = {"path": "data"}
+    assert xform.format_in(str(path), {}).to_dict("list") == {"a.b": [1, 2]}
+    chunks = xform.format_in_chunks(str(path), {}, 1)
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+
+
+def test_json_in_stream_chunks_align_columns(tmp_path):
+    path = tmp_path / "a.json"
+    path.write_text('[{"a":1,"b":2},{"a":5,"b":6},{"b":3,"a":4},{"c":9}]')
+    xform = sut.JsonIn()
+    xform.opts = {"stream": True}
+    frames = list(xform.format_in_chunks(str(path), {}, 2))
+    assert [list(frame.columns) for frame in frames] == [["a", "b"], ["a", "b", "c"]]
+    assert frames[1]["a"].tolist()[0] == 4
+    assert frames[1]["b"].tolist()[0] == 3
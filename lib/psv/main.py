@@ -3,24 +3,40 @@ import logging
 import json
 import sys
 import os
+import pandas as pd
 import devdriven.cli
 from devdriven.cli.types import Argv
 from devdriven.to_dict import to_dict
 from devdriven.random import set_seed
 from devdriven.config import Config
 from . import pipeline
+from .cache import ResultCache
+
+# Options before the first command:
+#   --explain      : Print the pipeline plan and optimized plan, do not run it.
+#   --no-optimize  : Run commands as given.
+#   --timing       : Print time, rows, bytes and process max RSS per command to STDERR.
+#   --cache        : Reuse outputs of previous runs: see cache.py.
+# Environment:
+#   PSV_COPY_ON_WRITE=0 : Disable pandas copy-on-write.
+MAIN_FLAGS = ("--explain", "--no-optimize", "--timing", "--cache")
+
+CONFIG_FILE = "~/.psv/config.yml"
 
 
 class Main(devdriven.cli.Main):
-    def __init__(self):
+    def __init__(self, config: Config | None = None):
         if seed := os.environ.get("PSV_RAND_SEED"):
             set_seed(seed)
+        # Commands copy input with copy(deep=False):
+        # with copy-on-write, column data is copied only when modified.
+        pd.set_option(
+            "mode.copy_on_write", os.environ.get("PSV_COPY_ON_WRITE", "1") != "0"
+        )
         super().__init__()
         self.prog_name = "psv"
         self.env = {}
-        self.config = Config(
-            file_default="~/.psv/config.yml", opts={}, env_prefix="PSV_", env=os.environ
-        ).load()
+        self.config = config or Main.load_config()
         self.env.update(
             {
                 "cwd": os.getcwd(),
@@ -32,6 +48,12 @@ class Main(devdriven.cli.Main):
         )
         logging.getLogger("urllib3").setLevel(logging.WARNING)
 
+    @staticmethod
+    def load_config() -> Config:
+        return Config(
+            file_default=CONFIG_FILE, opts={}, env_prefix="PSV_", env=os.environ
+        ).load()
+
     def parse_argv(self, argv: Argv):
         if not argv:
             argv = ["help", "--list"]
@@ -68,15 +90,25 @@ class Main(devdriven.cli.Main):
             self.name = "main"
             self.pipeline = None
             self.env = None
+            self.flags = {}
 
         def parse_argv(self, argv: Argv) -> Self:
+            while argv and argv[0] in MAIN_FLAGS:
+                self.flags[argv[0].removeprefix("--")] = True
+                argv = argv[1:]
             # pylint: disable-next=no-member
             pipe = self.main.parse_pipeline("main", argv)
             pipe.prepare_io()
+            if not self.flags.get("no-optimize"):
+                pipe.optimize()
             self.pipeline = pipe
             return self
 
         def exec(self) -> Any:
+            if self.flags.get("explain"):
+                # pylint: disable-next=no-member
+                self.main.stdout.write(self.pipeline.explain())
+                return None
             self.env.update(
                 {
                     # pylint: disable-next=no-member
@@ -87,7 +119,16 @@ class Main(devdriven.cli.Main):
                     "Content-Encoding": None,
                 }
             )
-            return self.pipeline.xform(None, self.env)
+            if self.flags.get("cache"):
+                self.env["result.cache"] = ResultCache()
+            try:
+                return self.pipeline.xform(None, self.env)
+            finally:
+                if self.flags.get("timing"):
+                    # pylint: disable-next=no-member
+                    self.main.stderr.write(
+                        pipeline.format_timing(self.env["history"])
+                    )
 
 
 if __name__ == "__main__":
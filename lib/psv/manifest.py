@@ -0,0 +1,99 @@
+from typing import Dict, Iterable, List
+import importlib
+import re
+
+# Command modules in help order:
+#   (module, command names and aliases, suffixes)
+# Keep in sync with command docstrings: see manifest_test.py.
+MANIFEST = [
+    ("io", "in i -i out o o-", ""),
+    ("generic", "table-in -table table-out table-", ".txt"),
+    ("tsv", "tsv-in -tsv tsv-out tsv-", ".tsv"),
+    ("csv", "csv-in -csv csv-out csv- csv", ".csv"),
+    (
+        "markdown",
+        "markdown-in -markdown -md md-in markdown-out markdown- markdown md-out md- md",
+        ".md .markdown",
+    ),
+    (
+        "json",
+        "json-in -json -js json-out json- json js- js "
+        "jsonl-in -jsonl -ndjson jsonl-out jsonl- jsonl ndjson-",
+        ".json .jsonl .ndjson",
+    ),
+    (
+        "pickle",
+        "dataframe-in -dataframe dataframe-out dataframe- dataframe",
+        ".pickle .pickle.gz .pickle.zst .pickle.xz .pickle.bz2",
+    ),
+    ("parquet", "parquet-in -parquet parquet-out parquet- parquet", ".parquet"),
+    (
+        "feather",
+        "feather-in -feather arrow-in -arrow feather-out feather- feather arrow-out arrow-",
+        ".feather .arrow",
+    ),
+    ("html", "html-out html- html", ".html .htm"),
+    ("sql", "-sql sql-", ""),
+    ("yaml", "yaml-out yaml- yaml yml- yml", ".yaml .yml"),
+    ("spreadsheet", "xls-in -xls xls-out xls- xls", ".xlsx"),
+    (
+        "process",
+        "range r head h tail t reverse tac shuffle rand copy cp dup cut c x uniq u "
+        "sort s grep g translate tr transpose xp null",
+        "",
+    ),
+    ("sed", "sed", ""),
+    ("summary", "count freq summary stats", ""),
+    ("cast", "cast astype coerce", ""),
+    ("unit", "unit convert", ""),
+    (
+        "metadata",
+        "add-sequence seq rename-columns rename infer-objects infer "
+        "show-columns columns cols env-",
+        "",
+    ),
+    ("extract", "extract rx re rex", ""),
+    ("expr", "eval each select where", ""),
+    ("repl", "repl", ""),
+    ("fanout", "fan-out fork", ""),
+    ("help", "help", ""),
+    ("example", "example ex examples", ""),
+]
+
+# Commands that describe all other commands:
+LOADS_ALL = ("help", "example")
+
+MODULE_FOR_NAME: Dict[str, str] = {
+    name: module for module, names, _suffixes in MANIFEST for name in names.split()
+}
+
+
+def load_all_commands() -> None:
+    for module, _names, _suffixes in MANIFEST:
+        load_module(module)
+
+
+def load_command(name: str) -> None:
+    module = MODULE_FOR_NAME.get(name)
+    if not module or module in LOADS_ALL:
+        load_all_commands()
+    else:
+        load_module(module)
+
+
+def load_commands_for_suffixes(suffixes: Iterable[str | None]) -> None:
+    for module in modules_for_suffixes(suffixes):
+        load_module(module)
+
+
+def modules_for_suffixes(suffixes: Iterable[str | None]) -> List[str]:
+    wanted = set(filter(None, suffixes))
+    return [
+        module
+        for module, _names, module_suffixes in MANIFEST
+        if wanted & set(re.split(r"[\s,]+", module_suffixes))
+    ]
+
+
+def load_module(module: str) -> None:
+    importlib.import_module(f"psv.{module}")
@@ -0,0 +1,21 @@
+from devdriven.cli.application import app
+import psv.manifest as sut
+from psv.command import suffix_list
+
+
+def test_manifest_matches_commands():
+    sut.load_all_commands()
+    suffixes = {module: sufs.split() for module, _names, sufs in sut.MANIFEST}
+    for desc in app.descriptors:
+        module = desc.klass.__module__.removeprefix("psv.")
+        for name in [desc.name, *desc.aliases]:
+            assert sut.MODULE_FOR_NAME.get(name) == module, name
+        assert set(suffix_list(desc)) <= set(suffixes[module]), desc.name
+
+
+def test_modules_for_suffixes():
+    fut = sut.modules_for_suffixes
+    assert fut([".csv"]) == ["csv"]
+    assert fut([".md", None]) == ["markdown"]
+    assert fut([".pickle.xz", ".xz"]) == ["pickle"]
+    assert not fut([".unknown"])
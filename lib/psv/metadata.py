@@ -39,7 +39,7 @@ class AddSequence(Command):
     """
 
     def xform(self, inp, env):
-        out = inp.copy()
+        out = inp.copy(deep=False)
         if self.opt("uuid"):
             self.add_uuid(out, env)
         else:
@@ -153,6 +153,9 @@ class EnvOut(Command):
 
     """
 
+    def is_cacheable(self) -> bool:
+        return False
+
     def xform(self, _inp, env):
         env["Content-Type"] = "application/x-psv-env"
         return to_dict(env)
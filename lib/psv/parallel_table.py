@@ -0,0 +1,112 @@
+from typing import Any, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+import mmap
+import pandas as pd
+
+QUOTE = b'"'
+NEWLINE = b"\n"
+
+Range = Tuple[int, int]
+
+
+def parallel_jobs(jobs: Any) -> int:
+    """
+    The number of processes to parse a local file with: 1 unless given.
+    """
+    if jobs is None:
+        return 1
+    return max(int(jobs), 1)
+
+
+def read_table_parallel(
+    path: str, header: int | None, jobs: int, **kwargs
+) -> pd.DataFrame:
+    """
+    Parses ranges of lines of a local file in parallel processes.
+    Ranges end at newlines outside of quoted fields,
+    found by counting quotes: a quote in an unquoted field
+    can give ranges that do not parse.
+    Columns parsed as different types in different ranges
+    are parsed again as strings, as a single pd.read_table would.
+    """
+    # Each range is parsed with the names of all columns:
+    sample_kwargs = {k: v for k, v in kwargs.items() if k != "usecols"}
+    sample = pd.read_table(path, header=header, nrows=1, **sample_kwargs)
+    names = list(sample.columns) if header == 0 else list(range(sample.shape[1]))
+    with open(path, "rb") as io:
+        with mmap.mmap(io.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = line_end(data, 0) if header == 0 else 0
+            ranges = split_ranges(data, start, jobs)
+    if not ranges:
+        return pd.read_table(path, header=header, nrows=0, **kwargs)
+    kwargs = kwargs | {"header": None, "names": names}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        frames = list(executor.map(read_range, [(path, rng, kwargs) for rng in ranges]))
+        if conflicts := conflicting_columns(frames):
+            kwargs["dtype"] = dict.fromkeys(conflicts, str)
+            again = [
+                i
+                for i, frame in enumerate(frames)
+                if any(frame[col].dtype != object for col in conflicts)
+            ]
+            tasks = [(path, ranges[i], kwargs) for i in again]
+            for i, frame in zip(again, executor.map(read_range, tasks)):
+                frames[i] = frame
+    return pd.concat(frames, ignore_index=True)
+
+
+def split_ranges(data, start: int, jobs: int) -> List[Range]:
+    """
+    Splits data[start:] into about `jobs` ranges of whole lines.
+    """
+    size = len(data)
+    ends = []
+    in_quotes = False
+    prev = start
+    for i in range(1, jobs):
+        target = max(start + (size - start) * i // jobs, prev)
+        # Quotes before target determine if target is within a quoted field:
+        in_quotes ^= data[prev:target].count(QUOTE) % 2 == 1
+        end = line_end(data, target, in_quotes)
+        if end >= size:
+            break
+        in_quotes = False
+        ends.append(end)
+        prev = end
+    ends.append(size)
+    starts = [start, *ends[:-1]]
+    return [(s, e) for s, e in zip(starts, ends) if e > s]
+
+
+def line_end(data, pos: int, in_quotes: bool = False) -> int:
+    """
+    The position after the first newline at or after pos that is not in a quoted field.
+    """
+    while (newline := data.find(NEWLINE, pos)) >= 0:
+        in_quotes ^= data[pos:newline].count(QUOTE) % 2 == 1
+        pos = newline + 1
+        if not in_quotes:
+            return pos
+    return len(data)
+
+
+def read_range(task) -> pd.DataFrame:
+    path, (start, end), kwargs = task
+    with open(path, "rb") as io:
+        io.seek(start)
+        data = io.read(end - start)
+    return pd.read_table(BytesIO(data), **kwargs)
+
+
+def conflicting_columns(frames: List[pd.DataFrame]) -> List[Any]:
+    """
+    Columns that a single parse would not give the type of any of frames:
+    numbers of different types are combined by pd.concat.
+    """
+    conflicts = []
+    for col in frames[0].columns:
+        dtypes = {frame[col].dtype for frame in frames}
+        if len(dtypes) > 1 and not all(dtype.kind in "iuf" for dtype in dtypes):
+            conflicts.append(col)
+    return conflicts
@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+from psv.formats import read_table_with_header
+import psv.parallel_table as sut
+
+CSV = 'a,b,c\n1,"x\ny",3\n2,z,\n3,"say ""hi""\n",4.5\n4,w,x\n5,v,6\n'
+
+
+@pytest.mark.parametrize("jobs", [2, 3, 7])
+def test_read_table_parallel(tmp_path, jobs):
+    path = str(tmp_path / "a.csv")
+    with open(path, "w", encoding="utf-8") as io:
+        io.write(CSV)
+    expected = pd.read_table(path, sep=",")
+    result = sut.read_table_parallel(path, 0, jobs, sep=",")
+    pd.testing.assert_frame_equal(result, expected)
+    expected = pd.read_table(path, sep=",", header=None)
+    result = sut.read_table_parallel(path, None, jobs, sep=",")
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_split_ranges():
+    data = b'h\n1,"a\n\n"\n2,b\n3,c\n'
+    ranges = sut.split_ranges(data, 2, 4)
+    assert [data[start:end] for start, end in ranges] == [
+        b'1,"a\n\n"\n',
+        b"2,b\n",
+        b"3,c\n",
+    ]
+    assert sut.split_ranges(b"", 0, 4) == []
+
+
+def test_conflicting_columns():
+    frames = [
+        pd.DataFrame({"a": [1], "b": [1], "c": ["x"]}),
+        pd.DataFrame({"a": [1.5], "b": ["y"], "c": ["z"]}),
+    ]
+    assert sut.conflicting_columns(frames) == ["b"]
+
+
+def test_read_header_only(tmp_path):
+    path = str(tmp_path / "a.csv")
+    with open(path, "w", encoding="utf-8") as io:
+        io.write("a,b\n")
+    assert list(sut.read_table_parallel(path, 0, 4, sep=",").columns) == ["a", "b"]
+
+
+def test_read_table_with_stray_quote(tmp_path):
+    # Quotes in unquoted fields misplace ranges:
+    rows = ['"q\nr"', '5" disk', "4", '"\n"'] * 6
+    path = str(tmp_path / "a.tsv")
+    with open(path, "w", encoding="utf-8") as io:
+        io.write("n\tsize\n" + "".join(f"{i}\t{row}\n" for i, row in enumerate(rows)))
+    expected = pd.read_table(path)
+    for jobs in [2, 3, 5]:
+        result = read_table_with_header(path, True, jobs=jobs, sep="\t")
+        pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,80 @@
+import pandas as pd
+from .command import section, command
+from .formats import FormatIn, FormatOut, seekable, rewind
+from .pushdown import filter_expression
+
+section("Format", 20)
+
+
+@command
+class ParquetIn(FormatIn):
+    """
+    parquet-in - Read Parquet.
+    alias: -parquet
+
+    Requires pyarrow.
+    Reads only the columns used before a following `cut`.
+    Row groups are skipped by their statistics for simple `select` comparisons.
+
+    $ psv in a.tsv // parquet- // o /tmp/a.parquet
+    $ psv in /tmp/a.parquet // select 'a > 1' // cut a,b // md
+
+    :suffixes: .parquet
+    """
+
+    def default_encoding(self):
+        return None
+
+    def wants_input_file(self):
+        return True
+
+    def format_in(self, readable, _env):
+        # pylint: disable-next=import-outside-toplevel
+        import pyarrow.parquet
+
+        readable = seekable(readable)
+        names = pyarrow.parquet.read_schema(readable).names
+        columns = self.pushdown.columns_in(names)
+        if filters := self.pushdown.filters_in(names):
+            try:
+                return pd.read_parquet(
+                    rewind(readable),
+                    columns=columns,
+                    filters=filter_expression(filters),
+                )
+            # Predicates that do not apply to the column types are left to select:
+            except (pyarrow.ArrowException, TypeError, ValueError):
+                pass
+        return pd.read_parquet(rewind(readable), columns=columns)
+
+
+@command
+class ParquetOut(FormatOut):
+    """
+    parquet-out - Write Parquet.
+    alias: parquet-, parquet
+
+    Requires pyarrow.
+
+    --compression=NAME  |  snappy, gzip, brotli, zstd or none.  Default: snappy.
+
+    $ psv in a.tsv // parquet- // o /tmp/a.parquet
+
+    :suffixes: .parquet
+    """
+
+    def default_encoding(self):
+        return None
+
+    def setup_env(self, inp, env):
+        super().setup_env(inp, env)
+        env["Content-Type"] = "application/vnd.apache.parquet"
+
+    def format_out(self, inp, _env, writeable):
+        compression = self.opt("compression", "snappy")
+        inp.to_parquet(
+            writeable,
+            index=False,
+            compression=None if compression == "none" else compression,
+        )
+
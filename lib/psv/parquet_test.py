@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+from psv.pushdown import Pushdown
+from psv.feather import FeatherIn, FeatherOut
+import psv.parquet as sut
+
+pytest.importorskip("pyarrow")
+
+
+def frame():
+    return pd.DataFrame({"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"], "c": [1.5] * 4})
+
+
+def read(cls, path, pushdown):
+    xform = cls()
+    xform.pushdown = pushdown
+    return xform.format_in(str(path), {})
+
+
+@pytest.mark.parametrize(
+    "cls_in,cls_out", [(sut.ParquetIn, sut.ParquetOut), (FeatherIn, FeatherOut)]
+)
+def test_pushdown(tmp_path, cls_in, cls_out):
+    path = tmp_path / "a"
+    out = cls_out()
+    out.opts = {}
+    with open(path, "wb") as io:
+        out.format_out(frame(), {}, io)
+    assert read(cls_in, path, Pushdown()).equals(frame())
+    result = read(cls_in, path, Pushdown(columns=["b", "a"], filters=[("a", ">", 2)]))
+    assert result.to_dict("list") == {"a": [3, 4], "b": ["y", "z"]}
+    # Filters that do not apply are left to select:
+    result = read(cls_in, path, Pushdown(filters=[("b", ">", 2)]))
+    assert len(result) == 4
+
+
+@pytest.mark.parametrize(
+    "cls_in,cls_out", [(sut.ParquetIn, sut.ParquetOut), (FeatherIn, FeatherOut)]
+)
+def test_pushdown_not_equal_keeps_nulls(tmp_path, cls_in, cls_out):
+    path = tmp_path / "a"
+    out = cls_out()
+    out.opts = {}
+    with open(path, "wb") as io:
+        out.format_out(pd.DataFrame({"a": [1, 2, None, 4]}), {}, io)
+    # As select 'a != 2':
+    result = read(cls_in, path, Pushdown(filters=[("a", "!=", 2)]))
+    assert result["a"].tolist()[0::2] == [1, 4]
+    assert result["a"].isna().tolist() == [False, True, False]
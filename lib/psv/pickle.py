@@ -1,9 +1,20 @@
+from io import BytesIO
+import mmap
+import pickle
+import shutil
+import struct
 import pandas as pd
 from .command import section, command
-from .formats import FormatIn, FormatOut
+from .compression import compress_writable, compression_for_path
+from .formats import FormatIn, FormatOut, rewind
 
 section("Format", 20)
 
+# Header of pickles with protocol 5 out-of-band buffers:
+BUFFERS_MAGIC = b"PSVPKL5\n"
+# Buffers are aligned for vectorized access:
+BUFFER_ALIGNMENT = 64
+
 
 @command
 class PickleIn(FormatIn):
@@ -11,14 +22,34 @@ class PickleIn(FormatIn):
     dataframe-in - Read Pandas Dataframe pickle.
     alias: -dataframe
 
-    :suffixes: .pickle.xz
+    Compression is detected by suffix or leading bytes.
+    Uncompressed pickles written with `dataframe-out --fast` are memory-mapped:
+    their buffers are not copied.
+
+    :suffixes: .pickle, .pickle.gz, .pickle.zst, .pickle.xz, .pickle.bz2
     """
 
     def default_encoding(self):
         return None
 
+    def wants_input_file(self):
+        return True
+
     def format_in(self, readable, _env):
-        return pd.read_pickle(readable, compression="xz")
+        if isinstance(readable, str):
+            with open(readable, "rb") as io:
+                magic = io.read(len(BUFFERS_MAGIC))
+            if magic != BUFFERS_MAGIC:
+                return pd.read_pickle(readable, compression=None)
+            with open(readable, "rb") as io:
+                # Pages are copied only if a frame is modified in place:
+                data = memoryview(mmap.mmap(io.fileno(), 0, access=mmap.ACCESS_COPY))
+            return load_with_buffers(data)
+        data = BytesIO()
+        shutil.copyfileobj(readable, data)
+        if data.getbuffer()[: len(BUFFERS_MAGIC)] != BUFFERS_MAGIC:
+            return pd.read_pickle(rewind(data), compression=None)
+        return load_with_buffers(data.getbuffer())
 
 
 @command
@@ -27,7 +58,18 @@ class PickleOut(FormatOut):
     dataframe-out - Write Pandas DataFrame pickle.
     alias: dataframe-, dataframe
 
-    :suffixes: .pickle.xz
+    Pickles use protocol 5.
+    The default compression is by the suffix of a following `out` file,
+    otherwise xz.
+
+    --compression=NAME  |  none, gzip, bz2, zstd or xz.
+    --fast              |  Uncompressed, with out-of-band buffers: read without copying.
+
+    $ psv in a.csv // dataframe- --compression=gzip // o /tmp/a.pickle.gz
+    $ psv in a.csv // dataframe- --fast // o /tmp/a.pickle
+    $ psv in /tmp/a.pickle // md
+
+    :suffixes: .pickle, .pickle.gz, .pickle.zst, .pickle.xz, .pickle.bz2
     """
 
     def default_encoding(self):
@@ -36,6 +78,69 @@ class PickleOut(FormatOut):
     def setup_env(self, inp, env):
         super().setup_env(inp, env)
         env["Content-Type"] = "application/x-pandas-dataframe-pickle"
+        compression = "none" if self.opt("fast", False) else self.compression()
+        env["Content-Encoding"] = None if compression == "none" else compression
 
     def format_out(self, inp, _env, writeable):
-        inp.to_pickle(writeable, compression="xz")
+        if self.opt("fast", False):
+            dump_with_buffers(inp, writeable)
+            return
+        compression = self.compression()
+        if compression == "none":
+            pickle.dump(inp, writeable, protocol=5)
+            return
+        with compress_writable(writeable, compression) as compressed:
+            pickle.dump(inp, compressed, protocol=5)
+
+    def compression(self) -> str:
+        if compression := self.opt("compression"):
+            return compression
+        if path := self.output_path:
+            if compression := compression_for_path(path):
+                return compression
+            if path.endswith(".pickle"):
+                return "none"
+        return "xz"
+
+
+def dump_with_buffers(value, writeable) -> None:
+    """
+    Writes:
+      BUFFERS_MAGIC
+      the number of buffers and the size of the pickle,
+      the offset and size of each buffer,
+      the pickle,
+      each buffer, aligned.
+    """
+    buffers = []
+    data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    views = [buffer.raw() for buffer in buffers]
+    offset = len(BUFFERS_MAGIC) + 16 + 16 * len(views) + len(data)
+    header = [len(views), len(data)]
+    for view in views:
+        offset = aligned(offset)
+        header.extend([offset, view.nbytes])
+        offset += view.nbytes
+    writeable.write(BUFFERS_MAGIC)
+    writeable.write(struct.pack(f"<{len(header)}Q", *header))
+    writeable.write(data)
+    offset = len(BUFFERS_MAGIC) + 8 * len(header) + len(data)
+    for view in views:
+        writeable.write(bytes(aligned(offset) - offset))
+        writeable.write(view)
+        offset = aligned(offset) + view.nbytes
+
+
+def load_with_buffers(data: memoryview):
+    start = len(BUFFERS_MAGIC)
+    count, length = struct.unpack_from("<2Q", data, start)
+    spans = struct.unpack_from(f"<{2 * count}Q", data, start + 16)
+    start += 16 + 16 * count
+    buffers = [
+        data[offset : offset + size] for offset, size in zip(spans[0::2], spans[1::2])
+    ]
+    return pickle.loads(data[start : start + length], buffers=buffers)
+
+
+def aligned(offset: int) -> int:
+    return -(-offset // BUFFER_ALIGNMENT) * BUFFER_ALIGNMENT
@@ -0,0 +1,60 @@
+from io import BytesIO
+import pandas as pd
+import numpy as np
+import pytest
+import psv.pickle as sut
+
+
+def frame():
+    return pd.DataFrame({"a": np.arange(100), "b": np.linspace(0, 1, 100), "c": ["x"] * 100})
+
+
+def write(opts, output_path=None):
+    xform = sut.PickleOut()
+    xform.opts = opts
+    xform.output_path = output_path
+    out = BytesIO()
+    xform.format_out(frame(), {}, out)
+    return out.getvalue()
+
+
+def read(readable):
+    return sut.PickleIn().format_in(readable, {})
+
+
+@pytest.mark.parametrize(
+    "opts,output_path,magic",
+    [
+        ({}, None, b"\xfd7zXZ\x00"),
+        ({}, "a.pickle", b"\x80\x05"),
+        ({}, "a.pickle.gz", b"\x1f\x8b"),
+        ({"compression": "bz2"}, "a.pickle.gz", b"BZh"),
+        ({"fast": True}, None, sut.BUFFERS_MAGIC),
+    ],
+)
+def test_compression(opts, output_path, magic):
+    data = write(opts, output_path)
+    assert data.startswith(magic)
+
+
+def test_fast(tmp_path):
+    data = write({"fast": True})
+    path = tmp_path / "a.pickle"
+    path.write_bytes(data)
+    for readable in [str(path), BytesIO(data)]:
+        result = read(readable)
+        assert result.equals(frame())
+        # Buffers are views of the input:
+        assert not result["b"].to_numpy().flags.owndata
+    # Modified in place without changing the file:
+    result = read(str(path))
+    result.loc[0, "b"] = 2.0
+    assert read(str(path)).equals(frame())
+
+
+def test_read_standard(tmp_path):
+    data = write({}, "a.pickle")
+    path = tmp_path / "a.pickle"
+    path.write_bytes(data)
+    assert read(str(path)).equals(frame())
+    assert read(BytesIO(data)).equals(frame())
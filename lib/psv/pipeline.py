@@ -1,9 +1,15 @@
-from typing import Any, List
+from typing import Any, List, Tuple
+import itertools
 import shlex
 import pandas as pd
 from devdriven.util import shorten_string, get_safe
 from devdriven.cli.macro import MacroExpander
 from .content import Content
+from .chunks import Chunks, DEFAULT_CHUNK_SIZE
+from .formats import FormatOut
+from .plan import Optimizer, describe_plan
+from .pushdown import pushdown_for
+from .instrument import StageClock, StageStats
 from . import command, io
 
 CommandLine = List[str | List]
@@ -60,6 +66,7 @@ class Pipeline(command.Command):
         super().__init__(*args)
         self.xforms = []
         self.commands = []
+        self.plan = []
 
     def parse_argv(self, argv: List[str]):
         self.commands = self.expand_macros(argv)
@@ -91,16 +98,36 @@ class Pipeline(command.Command):
                 self.xforms.append(out_cmd)
         return self
 
+    def optimize(self):
+        self.plan = self.xforms
+        self.xforms = Optimizer(make_xform=self.make_xform).optimize(self.xforms)
+        return self
+
+    def explain(self) -> str:
+        lines = ["# plan:", *describe_plan(self.plan or self.xforms)]
+        lines += ["", "# optimized:", *describe_plan(self.xforms), ""]
+        return "\n".join(lines)
+
     def xform(self, inp, env):
         assert self.main
         history = env["history"]
+        if chunk_size := self.input_chunk_size():
+            env["input.chunk_size"] = chunk_size
+        self.stream_outputs()
+        self.push_down()
+        keys = self.cache_keys(env)
+        start, inp = self.resume_from_cache(keys, inp, env)
         xform_output = xform_input = inp
+        clock = StageClock()
+        stages = []
         i = 0
-        for xform in self.xforms:
+        for j, xform in enumerate(self.xforms[start:], start):
             xform.main = self.main
-            current = [describe_datum(xform), None, None, None]
+            current = [describe_datum(xform), None, None, None, None]
             history.append(current)
             xform_input = xform_output
+            stats = StageStats(rows_in=stages[-1].rows_out if stages else None)
+            stages.append(stats)
             try:
                 env["xform"].update(
                     {
@@ -111,7 +138,9 @@ class Pipeline(command.Command):
                         "current": current,
                     }
                 )
-                xform_output = xform.xform(xform_input, env)
+                with clock.measure(stats):
+                    xform_output = self.xform_stage(xform, xform_input, env)
+                xform_output = clock.instrument(xform_output, stats)
             # pylint: disable-next=broad-except
             except Exception as exc:
                 self.log("error", "%s", f"{exc}")
@@ -119,8 +148,101 @@ class Pipeline(command.Command):
             current[1] = describe_datum(xform_output)
             current[2] = env["Content-Type"]
             current[3] = env["Content-Encoding"]
+            current[4] = stats
+            if keys[j] and isinstance(xform_output, pd.DataFrame):
+                env["result.cache"].put(keys[j], xform_output)
+        # Streamed stages count rows as chunks are pulled downstream:
+        for prev, stats in zip(stages, stages[1:]):
+            stats.rows_in = prev.rows_out
         return xform_output
 
+    def cache_keys(self, env) -> List[str | None]:
+        # ResultCache key of each stage output, None if not cacheable:
+        keys: List[str | None] = [None] * len(self.xforms)
+        cache = env.get("result.cache")
+        if not (cache and self.xforms and isinstance(self.xforms[0], io.IoIn)):
+            return keys
+        if (identity := self.xforms[0].input_identity()) is None:
+            return keys
+        commands = []
+        for i, xform in enumerate(self.xforms):
+            if not xform.is_cacheable():
+                break
+            command = [xform.name, *xform.argv]
+            # Readers may read less, given the commands that follow:
+            if pushdown := getattr(xform, "pushdown", None):
+                command.append(repr(pushdown))
+            commands.append(command)
+            keys[i] = cache.key(identity, commands)
+        return keys
+
+    def resume_from_cache(self, keys, inp, env) -> Tuple[int, Any]:
+        # Skip stages up to the longest cached output:
+        for i in reversed(range(len(keys))):
+            if keys[i] and (cached := env["result.cache"].get(keys[i])) is not None:
+                env["Content-Type"] = "application/x-pandas-dataframe"
+                env["Content-Encoding"] = None
+                skipped = [
+                    [describe_datum(xform), None, None, None, None]
+                    for xform in self.xforms[: i + 1]
+                ]
+                skipped[-1][1:4] = [describe_datum(cached), env["Content-Type"], None]
+                env["history"].extend(skipped)
+                return i + 1, cached
+        return 0, inp
+
+    def stream_outputs(self):
+        # Formats write directly to the output of the next command:
+        for xform, next_xform in zip(self.xforms, self.xforms[1:]):
+            if isinstance(xform, FormatOut):
+                xform.streaming = isinstance(next_xform, io.IoOut)
+                if xform.streaming and len(next_xform.args) == 1:
+                    xform.output_path = next_xform.args[0]
+
+    def push_down(self):
+        # Readers may skip columns and rows that following commands do not use:
+        for i, xform in enumerate(self.xforms):
+            if is_reader(xform):
+                following = itertools.dropwhile(is_reader, self.xforms[i + 1 :])
+                xform.pushdown = pushdown_for(list(following))
+
+    def input_chunk_size(self) -> int | None:
+        # If a command can stop before all input is read,
+        # and only row-local commands precede it,
+        # the input is read in chunks and reading stops with it:
+        following = itertools.dropwhile(is_reader, self.xforms)
+        for i, xform in enumerate(following):
+            if not xform.is_row_local():
+                return None
+            if xform.stops_early():
+                limit = xform.row_limit()
+                return (i == 0 and limit) or DEFAULT_CHUNK_SIZE
+        return None
+
+    def xform_stage(self, xform, inp, env):
+        if isinstance(inp, Chunks):
+            if xform.is_row_local():
+                return xform.xform_chunks(inp, env)
+            inp = inp.concat()
+        return xform.xform(inp, env)
+
+
+def is_reader(xform) -> bool:
+    return xform.is_reader()
+
+
+def format_timing(history) -> str:
+    # pylint: disable-next=import-outside-toplevel
+    import tabulate
+
+    rows = [
+        [stage[0]] + list(stage[4].to_dict().values())
+        for stage in history
+        if stage[4] is not None
+    ]
+    headers = ["stage"] + list(StageStats().to_dict().keys())
+    return tabulate.tabulate(rows, headers=headers, floatfmt=".6f") + "\n"
+
 
 def describe_datum(datum):
     type_name = datum.__class__.__name__
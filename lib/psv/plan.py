@@ -0,0 +1,106 @@
+from typing import Callable, List
+import re
+import shlex
+from devdriven.util import split_flat
+from .command import Command
+
+Plan = List[Command]
+
+
+class Optimizer:
+    """
+    Rewrites a Plan into an equivalent Plan that does less work.
+    Rules are applied until none of them changes the Plan.
+    """
+
+    def __init__(self, make_xform: Callable):
+        self.make_xform = make_xform
+        self.rules = [
+            self.drop_null,
+            self.filter_before_sort,
+            self.merge_cuts,
+            self.sort_head_to_top_k,
+        ]
+
+    def optimize(self, plan: Plan) -> Plan:
+        plan = list(plan)
+        changed = True
+        while changed:
+            changed = False
+            for rule in self.rules:
+                if (rewritten := rule(plan)) is not None:
+                    plan, changed = rewritten, True
+        return plan
+
+    # null // ... => ...
+    def drop_null(self, plan: Plan) -> Plan | None:
+        if any(xform.name == "null" for xform in plan):
+            return [xform for xform in plan if xform.name != "null"]
+        return None
+
+    # sort ... // grep ... => grep ... // sort ...
+    # A sort --limit=N selects rows before they are filtered:
+    def filter_before_sort(self, plan: Plan) -> Plan | None:
+        def rule(a, b):
+            if a.opt("limit") is not None:
+                return None
+            if a.name == "sort" and is_order_independent_filter(b):
+                return [b, a]
+            return None
+
+        return rewrite_pairs(plan, rule)
+
+    # cut a,b,c // cut c,a => cut c,a
+    def merge_cuts(self, plan: Plan) -> Plan | None:
+        def rule(a, b):
+            if a.name == "cut" and b.name == "cut" and not a.opts and not b.opts:
+                a_cols, b_cols = cut_columns(a), cut_columns(b)
+                if a_cols is not None and b_cols is not None:
+                    if set(b_cols) <= set(a_cols):
+                        return [b]
+            return None
+
+        return rewrite_pairs(plan, rule)
+
+    # sort COL // head N => sort --limit=N COL
+    def sort_head_to_top_k(self, plan: Plan) -> Plan | None:
+        def rule(a, b):
+            if a.name == "sort" and b.name == "head" and a.opt("limit") is None:
+                if (count := b.row_limit()) is None:
+                    return None
+                return [self.make_xform(["sort", f"--limit={count}", *a.argv])]
+            return None
+
+        return rewrite_pairs(plan, rule)
+
+
+def rewrite_pairs(plan: Plan, rule: Callable) -> Plan | None:
+    for i in range(len(plan) - 1):
+        if (replacement := rule(plan[i], plan[i + 1])) is not None:
+            return plan[:i] + replacement + plan[i + 2 :]
+    return None
+
+
+def is_order_independent_filter(xform: Command) -> bool:
+    if xform.name == "grep":
+        return True
+    if xform.name == "select":
+        return not any(re.search(ORDER_DEPENDENT_RX, arg) for arg in xform.args)
+    return False
+
+
+ORDER_DEPENDENT_RX = re.compile(r"\b(?:offset|inp|out|env|FINISH|BREAK)\b")
+
+
+def cut_columns(xform: Command) -> List[str] | None:
+    cols = split_flat(xform.args, ",")
+    if all(re.match(PLAIN_COLUMN_RX, col) for col in cols):
+        return cols
+    return None
+
+
+PLAIN_COLUMN_RX = re.compile(r"^(?!-?\d+$)[^*?\[\]:@]+$")
+
+
+def describe_plan(plan: Plan) -> List[str]:
+    return [shlex.join([xform.name] + xform.argv) for xform in plan]
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+import psv.plan as sut
+
+
+def xform(name, *argv):
+    opts = dict(arg[2:].split("=", 1) for arg in argv if arg.startswith("--"))
+    args = [arg for arg in argv if not arg.startswith("--")]
+    return SimpleNamespace(
+        name=name,
+        args=args,
+        argv=list(argv),
+        opts=opts,
+        opt=opts.get,
+        row_limit=lambda: int(args[0]) if args and int(args[0]) >= 0 else None,
+    )
+
+
+def optimize(*plan):
+    result = sut.Optimizer(make_xform=lambda argv: xform(*argv)).optimize(list(plan))
+    return [[x.name] + x.argv for x in result]
+
+
+def test_drop_null():
+    assert optimize(xform("in"), xform("null", "a"), xform("out")) == [["in"], ["out"]]
+
+
+def test_filter_before_sort():
+    assert optimize(xform("sort", "a"), xform("grep", "b", "x")) == [
+        ["grep", "b", "x"],
+        ["sort", "a"],
+    ]
+    assert optimize(xform("sort", "a"), xform("select", "b > 2")) == [
+        ["select", "b > 2"],
+        ["sort", "a"],
+    ]
+    assert optimize(xform("sort", "a"), xform("select", "offset < 2")) == [
+        ["sort", "a"],
+        ["select", "offset < 2"],
+    ]
+    assert optimize(xform("sort", "a"), xform("head", "-5")) == [
+        ["sort", "a"],
+        ["head", "-5"],
+    ]
+    sort_head_grep = [xform("sort", "a"), xform("head", "2"), xform("grep", "d", "x")]
+    assert optimize(*sort_head_grep) == [
+        ["sort", "--limit=2", "a"],
+        ["grep", "d", "x"],
+    ]
+    assert optimize(xform("sort", "--limit=2", "a"), xform("select", "b > 2")) == [
+        ["sort", "--limit=2", "a"],
+        ["select", "b > 2"],
+    ]
+
+
+def test_merge_cuts():
+    assert optimize(xform("cut", "a,b,c"), xform("cut", "c", "a")) == [["cut", "c", "a"]]
+    assert optimize(xform("cut", "a,b"), xform("cut", "d")) == [
+        ["cut", "a,b"],
+        ["cut", "d"],
+    ]
+    assert optimize(xform("cut", "a*"), xform("cut", "a")) == [["cut", "a*"], ["cut", "a"]]
+    assert optimize(xform("cut", "a,2"), xform("cut", "a")) == [["cut", "a,2"], ["cut", "a"]]
@@ -2,6 +2,7 @@ import re
 from devdriven.util import get_safe, chunks, split_flat, parse_range, make_range
 from devdriven.random import get_seed
 from .command import Command, section, command
+from .chunks import Chunks
 from .util import select_columns, parse_col_or_index
 
 section("Manipulation", 30)
@@ -43,6 +44,31 @@ class Range(Command):
         out = inp.iloc[rng]
         return out
 
+    def is_row_local(self):
+        return self.row_limit() is not None
+
+    def xform_chunks(self, chunks, env):
+        def range_chunks():
+            yield self.xform(chunks.take(self.row_limit()).concat(), env)
+
+        return Chunks(range_chunks())
+
+    def row_limit(self):
+        # Only a range with non-negative start, end and step is bounded
+        # without knowing the number of input rows:
+        arg0 = get_safe(self.args, 0)
+        if arg0 and ":" in arg0:
+            start, end, step = (arg0.split(":") + ["", ""])[:3]
+        else:
+            start = self.arg_or_opt(0, "start", 0)
+            end = self.arg_or_opt(1, "end", None)
+            step = self.arg_or_opt(2, "step", 1)
+        if not all(re.match(r"^\d*$", str(x)) for x in (start, end, step)):
+            return None
+        if end in (None, "") or str(step) == "0":
+            return None
+        return int(end)
+
 
 def process_range(inp, start, end, step):
     return inp.iloc[make_range(start, end, step, len(inp))]
@@ -63,8 +89,21 @@ class Head(Command):
     """
 
     def xform(self, inp, _env):
-        count = int(self.arg_or_opt(0, "count", 10))
-        return process_range(inp, None, count, None)
+        return process_range(inp, None, self.count(), None)
+
+    # head -N needs all rows:
+    def is_row_local(self):
+        return self.row_limit() is not None
+
+    def xform_chunks(self, chunks, _env):
+        return chunks.take(self.row_limit())
+
+    def row_limit(self):
+        count = self.count()
+        return count if count >= 0 else None
+
+    def count(self):
+        return int(self.arg_or_opt(0, "count", 10))
 
 
 @command
@@ -117,6 +156,10 @@ class Shuffle(Command):
 
     """
 
+    # Without a seed, each run is different:
+    def is_cacheable(self) -> bool:
+        return bool(self.opt("seed"))
+
     def xform(self, inp, _env):
         if seed := self.opt("seed", get_seed()):
             seed = int(seed + "0".encode("utf-8").hex(), 16)
@@ -142,8 +185,11 @@ class Copy(Command):
 
     """
 
+    def is_row_local(self):
+        return True
+
     def xform(self, inp, _env):
-        out = inp.copy()
+        out = inp.copy(deep=False)
         # ???: handle numeric columns: `copy 2:e d:f`:
         for src_dst in split_flat(self.args, ","):
             src, dst = src_dst.split(":", 2)
@@ -174,6 +220,9 @@ class Cut(Command):
 
     """
 
+    def is_row_local(self):
+        return True
+
     def xform(self, inp, _env):
         return inp[select_columns(inp, split_flat(self.args, ","))]
 
@@ -205,6 +254,7 @@ class Sort(Command):
     Options:
 
     --reverse, -r     |  Sort descending.
+    --limit=N         |  Keep only the first N sorted rows.
 
     # Sort increasing:
     $ psv in a.tsv // seq i // sort c // md
@@ -236,9 +286,28 @@ class Sort(Command):
             col = parse_col_or_index(imp_cols, col)
             cols.append(col)
             ascending.append(order != "-")
+        if (limit := self.opt("limit")) is not None:
+            return sort_top_k(inp, cols, ascending, int(limit))
         return inp.sort_values(by=cols, ascending=ascending)
 
 
+def sort_top_k(inp, cols, ascending, limit):
+    # Only rows with one of the `limit` best values of the first column can be in the result.
+    # Sort those candidates, not the whole table.
+    if 0 <= limit < len(inp):
+        key = inp[cols[0]].reset_index(drop=True)
+        try:
+            if ascending[0]:
+                candidates = key.nsmallest(limit, keep="all")
+            else:
+                candidates = key.nlargest(limit, keep="all")
+        except TypeError:
+            candidates = None
+        if candidates is not None and len(candidates) >= limit:
+            inp = inp.iloc[sorted(candidates.index)]
+    return inp.sort_values(by=cols, ascending=ascending).iloc[:limit]
+
+
 @command
 class Grep(Command):
     """
@@ -269,6 +338,9 @@ class Grep(Command):
         self.has_filter = None
         self.filter_expr = 0
 
+    def is_row_local(self):
+        return True
+
     def xform(self, inp, _env):
         imp_cols = list(inp.columns)
         self.has_filter = None
@@ -344,6 +416,9 @@ class Translate(Command):
 
     """
 
+    def is_row_local(self):
+        return True
+
     def xform(self, inp, _env):
         if self.opt("delete"):
             trans = str.maketrans("", "", self.args[0])
@@ -356,7 +431,7 @@ class Translate(Command):
         def translate(x):
             return str(x).translate(trans)
 
-        out = inp.copy()
+        out = inp.copy(deep=False)
         for col in cols:
             out[col] = out[col].apply(translate)
         return out
@@ -393,5 +468,8 @@ class NullXform(Command):
     $ psv in a.tsv // null IGNORED --OPTION=VALUE // md
     """
 
+    def is_row_local(self):
+        return True
+
     def xform(self, inp, _env):
         return inp
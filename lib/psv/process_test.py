@@ -0,0 +1,22 @@
+import pandas as pd
+from psv.chunks import Chunks
+import psv.process as sut
+
+
+def head(*args):
+    xform = sut.Head()
+    xform.args = list(args)
+    xform.opts = {}
+    return xform
+
+
+def test_head():
+    inp = pd.DataFrame({"a": range(8)})
+    assert list(head("3").xform(inp, {})["a"]) == [0, 1, 2]
+    assert head("3").row_limit() == 3 and head("3").stops_early()
+    chunks = Chunks([inp.iloc[:4], inp.iloc[4:]])
+    assert list(head("3").xform_chunks(chunks, {}).concat()["a"]) == [0, 1, 2]
+    # All but the last rows:
+    assert list(head("-5").xform(inp, {})["a"]) == [0, 1, 2]
+    assert head("-5").row_limit() is None
+    assert not head("-5").stops_early() and not head("-5").is_row_local()
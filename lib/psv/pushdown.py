@@ -0,0 +1,246 @@
+from typing import Any, Dict, List, Tuple
+from dataclasses import dataclass, field
+import ast
+import re
+from devdriven.util import split_flat
+from .command import Command
+from .plan import PLAIN_COLUMN_RX, ORDER_DEPENDENT_RX, cut_columns
+
+Predicate = Tuple[str, str, Any]
+
+
+@dataclass
+class Pushdown:
+    """
+    What a reader may skip, given the commands that follow it:
+      columns  : only these columns are used, if not None.
+      filters  : only rows matching all of these (column, op, value) predicates
+                 are used.
+      patterns : only rows where each (column, regex) matches are used.
+      order    : rows are then sorted by these (column, ascending) keys.
+      limit    : only this many leading rows of those are used, if not None.
+      types    : columns cast in place by a following cast, to its first type.
+    Names may not exist in the input.
+    The commands that follow still run: readers may ignore any of this,
+    except that a limit applies only to rows filtered and sorted exactly as described.
+    """
+
+    columns: List[str] | None = None
+    filters: List[Predicate] = field(default_factory=list)
+    patterns: List[Tuple[str, str]] = field(default_factory=list)
+    order: List[Tuple[str, bool]] = field(default_factory=list)
+    limit: int | None = None
+    types: Dict[str, str] = field(default_factory=dict)
+
+    def columns_in(self, names: List[str]) -> List[str] | None:
+        if self.columns is None:
+            return None
+        return [name for name in names if name in self.columns]
+
+    def filters_in(self, names: List[str]) -> List[Predicate]:
+        return [pred for pred in self.filters if pred[0] in names]
+
+
+def pushdown_for(plan: List[Command]) -> Pushdown:
+    pushdown = pushed_rows(plan)
+    pushdown.columns = projected_columns(plan)
+    pushdown.types = cast_types(plan)
+    return pushdown
+
+
+# Columns used by the commands before a cut:
+def projected_columns(plan: List[Command]) -> List[str] | None:
+    used: List[str] = []
+    for xform in plan:
+        if xform.name == "cut":
+            if xform.opts or (cols := cut_columns(xform)) is None:
+                return None
+            return list(dict.fromkeys(used + cols))
+        if xform.name in ROW_SUBSET_COMMANDS:
+            continue
+        if (cols := columns_used(xform)) is None:
+            return None
+        used.extend(cols)
+    return None
+
+
+# Filters, patterns and order of the commands that precede any change to rows or values.
+# A limit is pushed only if those commands are described exactly:
+def pushed_rows(plan: List[Command]) -> Pushdown:
+    pushdown = Pushdown()
+    exact = True
+    for xform in plan:
+        if xform.name == "select":
+            terms = select_terms(xform)
+            predicates = [pred for term in terms or [] if (pred := comparison(term))]
+            pushdown.filters.extend(predicates)
+            exact = exact and terms is not None and len(predicates) == len(terms)
+        elif xform.name == "grep":
+            pushdown.patterns.extend(grep_patterns(xform))
+            # Only matching rows are selected, but not only by these patterns:
+            exact = False
+        elif xform.name == "cut":
+            continue
+        elif xform.name == "sort":
+            if (order := sort_order(xform)) is None:
+                pushdown.order, exact = [], False
+            else:
+                pushdown.order = order
+            if (limit := xform.opt("limit")) is not None:
+                # A negative limit keeps all but the last rows:
+                pushdown.limit = int(limit) if exact and int(limit) >= 0 else None
+                break
+        elif xform.name == "head":
+            pushdown.limit = xform.row_limit() if exact else None
+            break
+        else:
+            break
+    return pushdown
+
+
+# Columns cast in place, before any command uses their values:
+def cast_types(plan: List[Command]) -> Dict[str, str]:
+    for xform in plan:
+        if xform.name in ("cut", *ROW_SUBSET_COMMANDS):
+            continue
+        if xform.name == "cast":
+            return {
+                src: types[0]
+                for dst, src, types in cast_conversions(xform) or []
+                if dst == src and types
+            }
+        break
+    return {}
+
+
+# Commands that select rows without using column values:
+ROW_SUBSET_COMMANDS = ("head", "tail", "range", "reverse", "shuffle")
+
+
+def columns_used(xform: Command) -> List[str] | None:
+    if xform.name == "grep" and len(xform.args) > 1 and len(xform.args) % 2 == 0:
+        return xform.args[0::2]
+    if xform.name == "sort" and (order := sort_order(xform)) is not None:
+        return [col for col, _ascending in order]
+    if xform.name == "select" and not xform.opts:
+        return select_names(xform)
+    if xform.name == "cast" and (conversions := cast_conversions(xform)) is not None:
+        return [src for _dst, src, _types in conversions]
+    return None
+
+
+# (DST, SRC, TYPES) of cast DST=SRC:TYPE:... arguments:
+def cast_conversions(xform: Command) -> List[Tuple[str, str, List[str]]] | None:
+    conversions = []
+    for arg in split_flat(xform.args, ","):
+        col, _, types = arg.partition(":")
+        dst, _, src = col.partition("=")
+        src = src or dst
+        if not (re.match(PLAIN_COLUMN_RX, src) and re.match(PLAIN_COLUMN_RX, dst)):
+            return None
+        conversions.append((dst, src, types.split(":") if types else []))
+    return conversions
+
+
+def select_names(xform: Command) -> List[str] | None:
+    if any(re.search(ORDER_DEPENDENT_RX, arg) for arg in xform.args):
+        return None
+    try:
+        tree = ast.parse(";".join(xform.args))
+    except SyntaxError:
+        return None
+    names = [node.id for node in ast.walk(tree) if isinstance(node, ast.Name)]
+    if "row" in names or "ind" in names:
+        return None
+    return names
+
+
+# Terms of a select expression that must all be true:
+def select_terms(xform: Command) -> List[ast.expr] | None:
+    if xform.opts or len(xform.args) != 1 or select_names(xform) is None:
+        return None
+    try:
+        expr = ast.parse(xform.args[0], mode="eval").body
+    except SyntaxError:
+        return None
+    if isinstance(expr, ast.BoolOp):
+        return expr.values if isinstance(expr.op, ast.And) else None
+    return [expr]
+
+
+# (column, regex) pairs that must all match:
+def grep_patterns(xform: Command) -> List[Tuple[str, str]]:
+    if len(xform.args) < 2 or len(xform.args) % 2 != 0:
+        return []
+    if xform.opt("invert-match") or xform.opt("any"):
+        return []
+    patterns = []
+    for col, pat in zip(xform.args[0::2], xform.args[1::2]):
+        if xform.opt("fixed-strings"):
+            pat = re.escape(pat)
+        if xform.opt("case-insensitive"):
+            pat = f"(?i){pat}"
+        patterns.append((col, pat))
+    return patterns
+
+
+def sort_order(xform: Command) -> List[Tuple[str, bool]] | None:
+    if set(xform.opts) - {"reverse", "limit"} or not xform.args:
+        return None
+    default_order = "-" if xform.opt("reverse") else "+"
+    order = []
+    for col in split_flat(xform.args, ","):
+        direction = default_order
+        if match := re.match(r"^([^:]+):([-+]?)$", col):
+            col, direction = match[1], match[2]
+        if not re.match(PLAIN_COLUMN_RX, col):
+            return None
+        order.append((col, direction != "-"))
+    return order
+
+
+COMPARISONS = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+}
+FLIPPED = {"==": "==", "!=": "!=", "<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+
+def comparison(term) -> Predicate | None:
+    if not (isinstance(term, ast.Compare) and len(term.ops) == 1):
+        return None
+    left, right = term.left, term.comparators[0]
+    if not (op := COMPARISONS.get(type(term.ops[0]))):
+        return None
+    if isinstance(left, ast.Constant) and isinstance(right, ast.Name):
+        left, right, op = right, left, FLIPPED[op]
+    if isinstance(left, ast.Name) and isinstance(right, ast.Constant):
+        if right.value is not None:
+            return (left.id, op, right.value)
+    return None
+
+
+# A pyarrow.compute expression for filters.
+# Arrow comparisons with null are null, which drops the row,
+# but NaN != value is True in select:
+def filter_expression(filters: List[Predicate]):
+    # pylint: disable-next=import-outside-toplevel
+    import pyarrow.compute
+
+    ops = {
+        "==": lambda a, b: a == b,
+        "!=": lambda a, b: (a != b) | a.is_null(),
+        "<": lambda a, b: a < b,
+        "<=": lambda a, b: a <= b,
+        ">": lambda a, b: a > b,
+        ">=": lambda a, b: a >= b,
+    }
+    expr = None
+    for col, op, val in filters:
+        term = ops[op](pyarrow.compute.field(col), val)
+        expr = term if expr is None else expr & term
+    return expr
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+import psv.pushdown as sut
+
+
+def xform(name, *args, **opts):
+    def row_limit():
+        count = int(args[0]) if args else 10
+        return count if count >= 0 else None
+
+    return SimpleNamespace(
+        name=name,
+        args=list(args),
+        opts=opts,
+        opt=lambda k, d=None: opts.get(k, d),
+        row_limit=row_limit,
+    )
+
+
+def test_projected_columns():
+    assert sut.projected_columns([xform("cut", "a,b")]) == ["a", "b"]
+    assert sut.projected_columns([xform("head"), xform("cut", "a", "b")]) == ["a", "b"]
+    assert sut.projected_columns(
+        [xform("grep", "c", "x"), xform("select", "d > 1"), xform("cut", "a")]
+    ) == ["c", "d", "a"]
+    assert sut.projected_columns([xform("cut", "a*")]) is None
+    plan = [xform("select", "row.a > 1"), xform("cut", "a")]
+    assert sut.projected_columns(plan) is None
+    assert sut.projected_columns([xform("md")]) is None
+
+
+def filters(*plan):
+    return sut.pushed_rows(list(plan)).filters
+
+
+def limit(*plan):
+    return sut.pushed_rows(list(plan)).limit
+
+
+def test_pushed_filters():
+    assert filters(xform("select", "a > 1 and 'x' == b")) == [
+        ("a", ">", 1),
+        ("b", "==", "x"),
+    ]
+    assert filters(xform("select", "a > 1 or b")) == []
+    assert filters(xform("select", "a.startswith('x') and c < 2")) == [("c", "<", 2)]
+    assert filters(xform("sort", "a"), xform("select", "a != 2")) == [("a", "!=", 2)]
+    assert filters(xform("sort", "a", limit=2), xform("select", "a < 2")) == []
+    assert filters(xform("head"), xform("select", "a < 2")) == []
+
+
+def test_pushed_patterns_and_order():
+    pushdown = sut.pushed_rows(
+        [
+            xform("grep", "a", "x.", "b", "^y", **{"fixed-strings": True}),
+            xform("sort", "b:-", "c", reverse=True),
+        ]
+    )
+    assert pushdown.patterns == [("a", r"x\."), ("b", r"\^y")]
+    assert pushdown.order == [("b", False), ("c", False)]
+    assert sut.pushed_rows([xform("grep", "x")]).patterns == []
+    plan = [xform("grep", "a", "x", **{"invert-match": True})]
+    assert sut.pushed_rows(plan).patterns == []
+    assert sut.pushed_rows([xform("sort", "1")]).order == []
+
+
+def test_pushed_limit():
+    assert limit(xform("head", "5")) == 5
+    # All but the last rows:
+    assert limit(xform("head", "-5")) is None
+    assert limit(xform("sort", "a", limit=-5)) is None
+    assert limit(xform("cut", "a"), xform("head")) == 10
+    assert limit(xform("select", "a > 1"), xform("sort", "a", limit=3)) == 3
+    assert limit(xform("select", "a > 1 and b"), xform("head")) is None
+    assert limit(xform("grep", "a", "x"), xform("head")) is None
+    assert limit(xform("sort", "1"), xform("head")) is None
+    assert limit(xform("md"), xform("head")) is None
+
+
+def test_pushdown_in():
+    filters = [("a", "<", 1), ("z", "<", 1)]
+    pushdown = sut.Pushdown(columns=["b", "a", "z"], filters=filters)
+    assert pushdown.columns_in(["a", "b", "c"]) == ["a", "b"]
+    assert pushdown.filters_in(["a", "b", "c"]) == [("a", "<", 1)]
+    assert sut.Pushdown().columns_in(["a"]) is None
+
+
+def test_cast_types():
+    plan = [xform("head"), xform("cast", "a:dt:epoch", "b=c:int,d")]
+    assert sut.cast_types(plan) == {"a": "dt"}
+    assert sut.projected_columns([*plan, xform("cut", "a,b")]) == ["a", "c", "d", "b"]
+    assert sut.cast_types([xform("grep", "a", "x"), xform("cast", "a:dt")]) == {}
@@ -15,6 +15,9 @@ class Repl(Command):
 
     """
 
+    def is_cacheable(self) -> bool:
+        return False
+
     def xform(self, inp, env):
         print("========================================")
         print("env:")
@@ -25,7 +28,7 @@ class Repl(Command):
         print("========================================\n")
         out = inp
         if getattr(inp, "copy", False):
-            out = inp.copy()
+            out = inp.copy(deep=False)
         bindings = globals()
         bindings.update(locals())
         start_repl(bindings)
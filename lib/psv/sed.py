@@ -26,8 +26,11 @@ class Sed(Command):
     $ psv in us-states.csv // sed -F --convert-to-string @4 , _ // head 5 // md
     """
 
+    def is_row_local(self):
+        return True
+
     def xform(self, inp, _env):
-        out = inp.copy()
+        out = inp.copy(deep=False)
         scans = create_scans(list(inp.columns), self.args, self.opt)
         for col, _search, replace, rx in scans:
             seq = out[col]
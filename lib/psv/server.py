@@ -0,0 +1,138 @@
+from typing import Dict, List, Tuple
+from contextlib import contextmanager
+import json
+import logging
+import os
+import socket
+import sys
+from devdriven.config import Config
+from .main import Main, CONFIG_FILE
+from .manifest import load_all_commands
+
+MAX_REQUEST_SIZE = 1024 * 1024
+
+
+class Server:
+    """
+    Runs psv commands in a warm process listening on a Unix socket.
+
+    Each request is a line of JSON: {"argv": [...], "cwd": "...", "env": {"PSV_...": "..."}},
+    sent with the client's STDIN, STDOUT and STDERR file descriptors.
+    The response is a line of JSON: {"exit_code": N}.
+
+    Requests are run one at a time, in this process:
+    imported modules, loaded configuration and caches survive across requests.
+    """
+
+    def __init__(self, path: str, prog_path: str):
+        self.path = path
+        self.prog_path = prog_path
+        self.configs: Dict[tuple, Tuple[tuple, Config]] = {}
+
+    def serve_forever(self):
+        load_all_commands()
+        with self.listen() as sock:
+            logging.info("psv server: listening on %s", self.path)
+            try:
+                while True:
+                    conn, _addr = sock.accept()
+                    with conn:
+                        self.handle(conn)
+            finally:
+                os.unlink(self.path)
+
+    def listen(self) -> socket.socket:
+        # Only the user may connect: requests run with the user's permissions.
+        # A new directory is private; the socket is private when bound:
+        if directory := os.path.dirname(self.path):
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            sock.bind(self.path)
+        except OSError:
+            sock.close()
+            raise
+        finally:
+            os.umask(umask)
+        sock.listen()
+        return sock
+
+    def handle(self, conn: socket.socket):
+        data, fds, _flags, _addr = socket.recv_fds(conn, MAX_REQUEST_SIZE, 3)
+        while not data.endswith(b"\n") and (more := conn.recv(MAX_REQUEST_SIZE)):
+            data += more
+        try:
+            exit_code = self.run(json.loads(data), fds)
+        # pylint: disable-next=broad-except
+        except Exception as exc:
+            logging.exception("psv server: %s", exc)
+            exit_code = 1
+        conn.sendall(json.dumps({"exit_code": exit_code}).encode("utf-8") + b"\n")
+
+    def run(self, request: dict, fds: List[int]) -> int:
+        stdin, stdout, stderr = [
+            os.fdopen(fd, mode) for fd, mode in zip(fds, ("r", "w", "w"))
+        ]
+        with stdin, stdout, stderr, client_env(request.get("env", {})):
+            os.chdir(request["cwd"])
+            main = Main(config=self.config())
+            main.prog_path = self.prog_path
+            main.stdin, main.stdout, main.stderr = stdin, stdout, stderr
+            main.run(["psv", *request["argv"]])
+            return main.exit_code
+
+    # Configuration depends on the client's PSV_* variables and the config file,
+    # which is loaded again when it changes:
+    def config(self) -> Config:
+        env = {k: v for k, v in os.environ.items() if k.startswith("PSV_")}
+        key = tuple(sorted(env.items()))
+        path = os.path.expanduser(env.get("PSV_CONFIG_FILE") or CONFIG_FILE)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if (cached := self.configs.get(key)) and cached[0] == (path, mtime):
+            return cached[1]
+        config = Main.load_config()
+        self.configs[key] = ((path, mtime), config)
+        return config
+
+
+@contextmanager
+def client_env(env: dict):
+    saved = {k: v for k, v in os.environ.items() if k.startswith("PSV_")}
+    cwd = os.getcwd()
+    for k in saved:
+        del os.environ[k]
+    # Commands that run psv must not call back into this busy server:
+    os.environ.update(
+        {
+            k: v
+            for k, v in env.items()
+            if k.startswith("PSV_") and k != "PSV_SERVER_SOCKET"
+        }
+    )
+    try:
+        yield
+    finally:
+        for k in [k for k in os.environ if k.startswith("PSV_")]:
+            del os.environ[k]
+        os.environ.update(saved)
+        os.chdir(cwd)
+
+
+def default_socket_path() -> str:
+    return os.environ.get("PSV_SERVER_SOCKET") or os.path.expanduser(
+        "~/.psv/server.sock"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    Server(
+        path=(sys.argv[1:] or [default_socket_path()])[0],
+        prog_path=os.environ["PSV_PROG_PATH"],
+    ).serve_forever()
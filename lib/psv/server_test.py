@@ -0,0 +1,16 @@
+import os
+import stat
+from psv.server import Server
+
+
+def test_listen(tmp_path):
+    path = tmp_path / "psv" / "server.sock"
+    umask = os.umask(0o022)
+    try:
+        with Server(str(path), "psv").listen():
+            assert stat.S_IMODE(os.stat(path.parent).st_mode) == 0o700
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+            assert stat.S_ISSOCK(os.stat(path).st_mode)
+        assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(umask)
@@ -32,7 +32,10 @@ class XlsIn(FormatIn):
         def read_workbook(filename):
             return load_workbook(filename=filename)
 
-        workbook = tempfile_from_readable(readable, ".xlsx", read_workbook)
+        if isinstance(readable, str):
+            workbook = read_workbook(readable)
+        else:
+            workbook = tempfile_from_readable(readable, ".xlsx", read_workbook)
         sheet_id = self.opt("sheet-name", 0)
         worksheet = workbook.worksheets[sheet_id]
         data = worksheet.values
@@ -45,7 +48,7 @@ class XlsIn(FormatIn):
         return pd.DataFrame(data, columns=cols)
 
     def wants_input_file(self):
-        return False
+        return True
 
     def default_encoding(self):
         return None
@@ -1,11 +1,22 @@
+from typing import Any, Dict, Tuple
+from decimal import Decimal
+from io import StringIO
+import csv
+import datetime
 import re
+import threading
 import pandas as pd
 from .command import section, command, Command
+from .chunks import Chunks, DEFAULT_CHUNK_SIZE
+from .pushdown import Pushdown
 
 section("I/O", 10)
 
 
 class SQLCommand(Command):
+    def is_cacheable(self) -> bool:
+        return False
+
     def make_engine(self, url: str):
         # pylint: disable-next=import-outside-toplevel
         import sqlalchemy
@@ -16,7 +27,15 @@ class SQLCommand(Command):
                 return str(config_vars.get(match[1], ""))
 
             url = re.sub(r"\{\{(\S+)\}\}", fetch, url)
-        return sqlalchemy.create_engine(url)
+        # Engines and their connection pools are reused for the life of the process:
+        with ENGINES_LOCK:
+            if (engine := ENGINES.get(url)) is None:
+                engine = ENGINES[url] = sqlalchemy.create_engine(url)
+        return engine
+
+
+ENGINES: Dict[str, Any] = {}
+ENGINES_LOCK = threading.Lock()
 
 
 @command
@@ -30,6 +49,15 @@ class SQLIn(SQLCommand):
       CONNECTION-URL             |  The database connection URL in sqlachmemy format.
       --columns=COL,...          |  Columns to read from table.  Default: all columns.
       --parse-dateslist=COL,...  |  List of column names to parse as dates.
+      --chunk-size=ROWS          |  Stream rows in chunks of ROWS.
+
+    Rows are fetched in chunks with a server-side cursor, where supported.
+    Only the columns used before a following `cut` are selected.
+    When reading a table, simple forms of following `select`, `grep` and `sort`
+    commands are added to the query as WHERE and ORDER BY clauses.
+    A following `head` adds a LIMIT, if the query filters and sorts rows exactly as
+    the preceding commands do.
+    All following commands still run.
 
     Examples:
 
@@ -45,23 +73,159 @@ class SQLIn(SQLCommand):
     # Query database:
     $ psv -sql 'SELECT * FROM gebrselassie WHERE time > "00:07:"' sqlite:////tmp/geb.db // sort time
 
+    # Filter, sort and limit in the database:
+    $ psv -sql gebrselassie sqlite:////tmp/geb.db // select 'time > "00:07:"' // sort time // head 3
+
     """
 
-    def xform(self, _inp, _env):
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Set by Pipeline: see pushdown.py.
+        self.pushdown = Pushdown()
+
+    def is_reader(self) -> bool:
+        return True
+
+    def xform(self, _inp, env):
         opts = {} | parse_opts(self.opts)
         # ic(opts)
+        chunk_size = opts.pop("chunk-size", None) or env.get("input.chunk_size")
+        columns = opts.pop("columns", None)
         url = self.args[-1]
         engine = self.make_engine(url)
         sql_or_table = " ".join(self.args[:-1]).strip()
-        if re.match(
+        query = self.make_query(engine, sql_or_table, columns)
+        connection = engine.connect().execution_options(stream_results=True)
+        try:
+            frames = pd.read_sql_query(
+                query,
+                connection,
+                chunksize=int(chunk_size or DEFAULT_CHUNK_SIZE),
+                **opts,
+            )
+        except BaseException:
+            connection.close()
+            raise
+        if not opts.get("index_col"):
+            frames = renumber(frames)
+        chunks = Chunks(frames).closing(connection)
+        return chunks if chunk_size else chunks.concat()
+
+    def make_query(self, engine, sql_or_table, columns):
+        # pylint: disable-next=import-outside-toplevel
+        import sqlalchemy
+
+        if match := re.match(
             r"^(?:(?P<schema>[_a-zA-Z][_a-zA-Z0-9]*)\.)?(?P<table>[_a-zA-Z][_a-zA-Z0-9]*)$",
             sql_or_table,
         ):
-            out = pd.read_sql_table(sql_or_table, engine, **opts)
+            table = sqlalchemy.Table(
+                match["table"],
+                sqlalchemy.MetaData(),
+                schema=match["schema"],
+                autoload_with=engine,
+            )
+            names = self.projected_columns(columns or list(table.columns.keys()))
+            # Strings compare by code point, as in Python, only in sqlite by default:
+            exact_strings = engine.dialect.name == "sqlite"
+            where, where_exact = self.where_clauses(table.columns, exact_strings)
+            order, order_exact = self.order_clauses(table.columns, exact_strings)
+            query = (
+                sqlalchemy.select(*[table.columns[name] for name in names])
+                .where(*where)
+                .order_by(*order)
+            )
+            exact = where_exact and order_exact
         else:
-            out = pd.read_sql_query(sql_or_table, engine, **opts)
-        # ic(out)
-        return out
+            sql = re.sub(r"[;\s]+$", "", sql_or_table)
+            pushdown = self.pushdown
+            # An outer select may not keep the order of the query:
+            ordered = re.search(r"(?i)\border\s+by\b", sql) is not None
+            if ordered or (pushdown.columns is None and pushdown.limit is None):
+                # Run as given: a colon is not a bind parameter:
+                return sql_or_table
+            subquery = (
+                sqlalchemy.text(sql.replace(":", "\\:")).columns().subquery("query")
+            )
+            query = sqlalchemy.select(sqlalchemy.literal_column("*")).select_from(
+                subquery
+            )
+            if pushdown.columns is not None:
+                with engine.connect() as connection:
+                    names = list(connection.execute(query.limit(0)).keys())
+                names = self.projected_columns(names)
+                query = sqlalchemy.select(*map(sqlalchemy.column, names)).select_from(
+                    subquery
+                )
+            exact = not (pushdown.filters or pushdown.patterns or pushdown.order)
+        if self.pushdown.limit is not None and exact:
+            query = query.limit(self.pushdown.limit)
+        return query
+
+    def where_clauses(self, columns, exact_strings):
+        # Clauses select at least the rows that the following commands select,
+        # and exactly those rows if exact:
+        # pylint: disable-next=import-outside-toplevel
+        import sqlalchemy
+
+        clauses = []
+        exact = True
+        for col, op, value in self.pushdown.filters:
+            column = columns.get(col)
+            kind = column_kind(column) if column is not None else None
+            if kind is None or kind != value_kind(value):
+                exact = False
+                continue
+            if kind is str and not exact_strings:
+                # Collations may compare more strings as equal, but not fewer:
+                exact = False
+                if op != "==":
+                    continue
+            clause = COMPARISONS[op](column, value)
+            # Comparisons with NULL are never true in SQL:
+            if op == "!=":
+                clause = sqlalchemy.or_(clause, column.is_(None))
+            clauses.append(clause)
+        for col, regex in self.pushdown.patterns:
+            exact = False
+            column = columns.get(col)
+            if column is None or column_kind(column) is not str:
+                continue
+            if (like := like_pattern(regex)) is None:
+                continue
+            pattern, ignore_case = like
+            if ignore_case and not re.fullmatch(ILIKE_SAFE_RX, pattern):
+                continue
+            if ignore_case:
+                clause = column.ilike(pattern, escape="\\")
+            else:
+                clause = column.like(pattern, escape="\\")
+            # grep matches NULL as text:
+            clauses.append(sqlalchemy.or_(clause, column.is_(None)))
+        return clauses, exact
+
+    def order_clauses(self, columns, exact_strings):
+        # pylint: disable-next=import-outside-toplevel
+        import sqlalchemy
+
+        clauses = []
+        exact = True
+        for col, ascending in self.pushdown.order:
+            if (column := columns.get(col)) is None:
+                return [], False
+            kind = column_kind(column)
+            exact = exact and (
+                kind in (float, datetime.date, datetime.datetime)
+                or (kind is str and exact_strings)
+            )
+            # Sort NULLs last, as pandas does:
+            clauses.append(sqlalchemy.case((column.is_(None), 1), else_=0))
+            clauses.append(column.asc() if ascending else column.desc())
+        return clauses, exact
+
+    def projected_columns(self, names):
+        # A cut of only unknown columns fails after the query:
+        return self.pushdown.columns_in(names) or names
 
 
 @command
@@ -72,6 +236,12 @@ class SQLOut(SQLCommand):
       DST-TABLE           |  Destination table name.
       CONNECTION-URL      |  The database connection URL in sqlachmemy format.
       --if-exists=ACTION  |  Action to take if table exists: `fail’, ‘replace’, ‘append’.  Default: `replace`.
+      --batch-size=ROWS   |  Rows inserted per batch.  Default: 10000.
+      --method=NAME       |  `executemany`, `multi` or `copy`.  Default: by database.
+
+    All rows are inserted in one transaction.
+    PostgreSQL with psycopg2 uses COPY FROM STDIN.
+    Other databases insert each batch with one prepared statement (executemany).
 
     Examples:
 
@@ -89,18 +259,123 @@ class SQLOut(SQLCommand):
         table_name = self.args[0]
         url = self.args[1]
         engine = self.make_engine(url)
+        opts = parse_opts(self.opts)
+        method = opts.pop("method", None) or default_insert_method(engine)
+        if method not in INSERT_METHODS:
+            raise Exception(f"sql-: unknown --method={method!r}")
         opts = {
-            "if_exists": "replace",
-            "chunksize": 1000,
-            "method": "multi",
+            "if_exists": opts.pop("if-exists", "replace"),
+            "chunksize": int(opts.pop("batch-size", DEFAULT_BATCH_SIZE)),
+            "method": INSERT_METHODS[method],
             "index": False,
-        } | parse_opts(self.opts)
+        } | opts
         # ic(opts)
         rows_written = inp.to_sql(table_name, engine, **opts)
         out = pd.DataFrame(data={"rows_written": [rows_written]})
         return out
 
 
+DEFAULT_BATCH_SIZE = 10000
+
+
+def default_insert_method(engine) -> str:
+    if engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg2":
+        return "copy"
+    return "executemany"
+
+
+def insert_with_copy(table, connection, keys, data_iter) -> int:
+    # to_sql method: COPY FROM STDIN of CSV, through psycopg2:
+    quote = connection.dialect.identifier_preparer.quote
+    name = quote(table.name)
+    if table.schema:
+        name = f"{quote(table.schema)}.{name}"
+    columns = ", ".join(map(quote, keys))
+    data = StringIO()
+    csv.writer(data).writerows(data_iter)
+    data.seek(0)
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {name} ({columns}) FROM STDIN WITH CSV", data)
+        return cursor.rowcount
+
+
+# to_sql methods:
+INSERT_METHODS = {
+    "executemany": None,
+    "multi": "multi",
+    "copy": insert_with_copy,
+}
+
+COMPARISONS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def column_kind(column) -> type | None:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+    if python_type is bool:
+        return bool
+    # Numbers of any type are compared by value:
+    if issubclass(python_type, (int, float, Decimal)):
+        return float
+    if python_type in (str, datetime.date, datetime.datetime):
+        return python_type
+    return None
+
+
+def value_kind(value) -> type | None:
+    if isinstance(value, bool):
+        return bool
+    if isinstance(value, (int, float)):
+        return float
+    if isinstance(value, str):
+        return str
+    return None
+
+
+# A regex that is a literal string, optionally anchored:
+LITERAL_REGEX_RX = re.compile(
+    r"^(?P<ignore_case>\(\?i\))?(?P<start>\^?)"
+    r"(?P<literal>(?:\\[^A-Za-z0-9]|[^.^$*+?{}\[\]\\|()])+)(?P<end>\$?)$"
+)
+
+
+# ILIKE may fold only ASCII letters, as lower() in sqlite does,
+# and (?i) also matches "i", "k" and "s" to non-ASCII letters.
+# Other literals select a superset of what grep -i selects:
+ILIKE_SAFE_RX = re.compile(r"[^iksIKS\x80-\U0010ffff]*")
+
+
+def like_pattern(regex: str) -> Tuple[str, bool] | None:
+    """
+    The LIKE pattern and case-insensitivity of a regex, if it is a literal string.
+    """
+    if not (match := LITERAL_REGEX_RX.match(regex)):
+        return None
+    literal = re.sub(r"\\(.)", r"\1", match["literal"])
+    literal = re.sub(r"([\\%_])", r"\\\1", literal)
+    start = "" if match["start"] else "%"
+    end = "" if match["end"] else "%"
+    return start + literal + end, bool(match["ignore_case"])
+
+
+def renumber(frames):
+    # Each chunk is indexed from 0:
+    start = 0
+    for frame in frames:
+        frame.index = pd.RangeIndex(start, start + len(frame))
+        start += len(frame)
+        yield frame
+
+
 def parse_opts(opts):
     result = opts.copy()
 
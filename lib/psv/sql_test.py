@@ -0,0 +1,130 @@
+from types import SimpleNamespace
+import pandas as pd
+import pytest
+import sqlalchemy
+from psv.chunks import Chunks
+from psv.pushdown import Pushdown
+import psv.sql as sut
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path}/a.db")
+    frame = pd.DataFrame({"a": range(10), "b": list("abcdefghij"), "c": [0.5] * 10})
+    frame.to_sql("t", engine, index=False)
+    statements = []
+    sqlalchemy.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_args: statements.append(statement),
+    )
+    engine.statements = statements
+    return engine
+
+
+def read(engine, args, pushdown=None, env=None, **opts):
+    xform = sut.SQLIn()
+    xform.main = SimpleNamespace(config=SimpleNamespace(opt=lambda _name: None))
+    xform.make_engine = lambda _url: engine
+    xform.args = [*args, "sqlite://"]
+    xform.opts = opts
+    xform.pushdown = pushdown or Pushdown()
+    return xform.xform(None, env or {})
+
+
+def test_table(engine):
+    out = read(engine, ["t"])
+    assert list(out.columns) == ["a", "b", "c"]
+    assert list(out.index) == list(range(10))
+    out = read(engine, ["t"], Pushdown(columns=["b", "x"], limit=3))
+    assert out.to_dict("list") == {"b": ["a", "b", "c"]}
+    assert "LIMIT" in engine.statements[-1]
+
+
+def test_query(engine):
+    query = "SELECT a, b FROM t WHERE a > 4;"
+    assert list(read(engine, [query])["a"]) == [5, 6, 7, 8, 9]
+    assert engine.statements[-1] == query
+    out = read(engine, [query], Pushdown(columns=["a"], limit=2))
+    assert out.to_dict("list") == {"a": [5, 6]}
+    # Colons are not bind parameters:
+    query = "SELECT b, 'a :b' AS z FROM t WHERE a = 1 \n"
+    assert read(engine, [query])["z"].tolist() == ["a :b"]
+    out = read(engine, [query], Pushdown(columns=["z"], limit=1))
+    assert out.to_dict("list") == {"z": ["a :b"]}
+    assert "LIMIT" in engine.statements[-1]
+    # The order of a query is not kept by an outer select:
+    query = "SELECT a, b FROM t ORDER BY a DESC"
+    for pushdown in [Pushdown(columns=["a"], limit=2), Pushdown(limit=2)]:
+        out = read(engine, [query], pushdown)
+        assert list(out["a"]) == list(range(9, -1, -1))
+        assert engine.statements[-1] == query
+
+
+def test_chunks(engine):
+    out = read(engine, ["t"], **{"chunk-size": "4"})
+    assert isinstance(out, Chunks)
+    frames = list(out)
+    assert [len(frame) for frame in frames] == [4, 4, 2]
+    assert list(pd.concat(frames).index) == list(range(10))
+    out = read(engine, ["t"], env={"input.chunk_size": 3})
+    assert len(out.take(4).concat()) == 4
+
+
+def test_where_order_limit(engine):
+    pushdown = Pushdown(
+        filters=[("a", ">", 2), ("b", "!=", "e"), ("c", "<", "x")],
+        patterns=[("b", "(?i)^[fg]"), ("b", "^[a-z]$")],
+        order=[("a", False)],
+    )
+    out = read(engine, ["t"], pushdown)
+    assert list(out["a"]) == [9, 8, 7, 6, 5, 3]
+    statement = engine.statements[-1]
+    assert "WHERE t.a > ? AND (t.b != ? OR t.b IS NULL)" in statement
+    assert "LIKE" not in statement and "ORDER BY" in statement
+    out = read(engine, ["t"], Pushdown(patterns=[("b", "(?i)^C")]))
+    assert list(out["b"]) == ["c"]
+    assert "lower(t.b) LIKE lower(?)" in engine.statements[-1]
+    # Only ASCII is folded by sqlite:
+    frame = pd.DataFrame({"s": ["école", "École", "SKI", "x"]})
+    frame.to_sql("u", engine, index=False)
+    for regex, expected in [("(?i)école", ["école", "École"]), ("(?i)ski", ["SKI"])]:
+        out = read(engine, ["u"], Pushdown(patterns=[("s", regex)]))
+        assert list(out["s"][out["s"].str.contains(regex)]) == expected
+        assert "LIKE" not in engine.statements[-1]
+    pushdown = Pushdown(filters=[("a", ">=", 5)], order=[("a", True)], limit=2)
+    out = read(engine, ["t"], pushdown)
+    assert list(out["a"]) == [5, 6]
+    assert "LIMIT" in engine.statements[-1]
+    # Rows are not limited unless filtered exactly:
+    pushdown = Pushdown(filters=[("c", ">", "x")], limit=2)
+    assert len(read(engine, ["t"], pushdown)) == 10
+    assert "LIMIT" not in engine.statements[-1]
+
+
+def test_like_pattern():
+    assert sut.like_pattern("ab") == ("%ab%", False)
+    assert sut.like_pattern(r"(?i)^a\.b_$") == (r"a.b\_", True)
+    assert sut.like_pattern("a%") == (r"%a\%%", False)
+    assert sut.like_pattern("a.b") is None
+    assert sut.like_pattern("") is None
+
+
+def test_write(tmp_path):
+    xform = sut.SQLOut()
+    xform.main = SimpleNamespace(config=SimpleNamespace(opt=lambda _name: None))
+    url = f"sqlite:///{tmp_path}/b.db"
+    xform.args = ["t", url]
+    xform.opts = {"batch-size": "300"}
+    frame = pd.DataFrame({"a": range(1000), "b": ["x"] * 1000})
+    out = xform.xform(frame, {})
+    assert out["rows_written"][0] == 1000
+    xform.opts = {"if-exists": "append", "method": "multi", "batch-size": "100"}
+    xform.xform(frame, {})
+    engine = xform.make_engine(url)
+    # Engines are reused:
+    assert engine is xform.make_engine(url)
+    assert len(pd.read_sql_query("SELECT * FROM t", engine)) == 2000
+    xform.opts = {"method": "bulk"}
+    with pytest.raises(Exception, match="unknown --method"):
+        xform.xform(frame, {})
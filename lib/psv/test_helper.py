@@ -6,7 +6,12 @@ def fix_line(line):
     def replace(m):
         return f"{m[1]}...{m[3]}\n"
 
-    return re.sub(r'( *"(?:now|cwd)": *")(:?[^"]*)("\S*)\s*', replace, line)
+    line = re.sub(r'( *"(?:now|cwd)": *")(:?[^"]*)("\S*)\s*', replace, line)
+    return re.sub(
+        r'( *"(?:wall_time|cpu_time|bytes_out|max_rss)": *)([-+.\deE]+)(,?)\s*$',
+        replace,
+        line,
+    )
 
 
 if __name__ == "__main__":
@@ -10,7 +10,10 @@ class TsvIn(FormatIn):
       tsv-in - Parse TSV.
       aliases: -tsv
 
-    --header  |  First row is header.  Default: True.
+    --header            |  First row is header.  Default: True.
+    --chunk-size=ROWS   |  Stream rows in chunks of ROWS.
+    --parse-jobs=N      |  Processes parsing a local file.  Default: 1.
+    --engine=NAME       |  Parser: `c` or `pyarrow`.  Default: `c`.
 
     # Convert TSV stdin to CSV stdout:
     $ cat a.tsv | psv -tsv // csv-
@@ -24,8 +27,27 @@ class TsvIn(FormatIn):
       :suffixes: .tsv
     """
 
+    def wants_input_file(self):
+        return True
+
     def format_in(self, readable, _env):
-        return read_table_with_header(readable, self.opt("header", True), sep="\t")
+        return read_table_with_header(
+            readable,
+            self.opt("header", True),
+            jobs=self.opt("parse-jobs"),
+            engine=self.opt("engine"),
+            pushdown=self.pushdown,
+            sep="\t",
+        )
+
+    def format_in_chunks(self, readable, _env, chunk_size):
+        return read_table_with_header(
+            readable,
+            self.opt("header", True),
+            pushdown=self.pushdown,
+            sep="\t",
+            chunksize=chunk_size,
+        )
 
 
 @command
@@ -40,5 +62,14 @@ class TsvOut(FormatOut):
       :suffixes: .tsv
     """
 
+    def is_row_local(self):
+        return True
+
     def format_out(self, inp, _env, writeable):
         inp.to_csv(writeable, sep="\t", header=True, index=False, date_format="iso")
+
+    def format_out_chunks(self, chunks, _env, writeable):
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(
+                writeable, sep="\t", header=i == 0, index=False, date_format="iso"
+            )
@@ -1,4 +1,5 @@
 from typing import List, Dict
+from functools import cache
 import re
 import pandas as pd
 from devdriven import lazy_import
@@ -24,6 +25,11 @@ def define_units(units: Dict[str, str], aliases: Dict[str, str]):
     u.add_enabled_aliases(new_aliases)
 
 
+@cache
+def define_default_units():
+    define_units(UNITS, UNIT_ALIASES)
+
+
 ###############################################
 
 
@@ -92,9 +98,9 @@ cut event,distance,time,min_per_mile // md
 """
 
     def xform(self, inp, _env):
-        define_units(UNITS, UNIT_ALIASES)  # ??? DO THIS ONCE!
+        define_default_units()
         conversions = parse_conversions(inp, self.args)
-        out = inp.copy()
+        out = inp.copy(deep=False)
         for out_col, inp_col, out_units in conversions:
             out[out_col] = self.convert_col(out, inp_col, out_units)
         return out
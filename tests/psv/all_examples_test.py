@@ -7,9 +7,12 @@ from devdriven.io import BroadcastIO
 from devdriven.asserts import assert_output_by_key, assert_log
 from devdriven.cli.application import app
 import psv.main
+from psv.manifest import load_all_commands
 from psv.test_helper import fix_line
 from psv.example import ExampleRunner
 
+load_all_commands()
+
 ####################################
 
 